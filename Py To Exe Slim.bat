@@ -0,0 +1,4 @@
+@echo off
+rem Slim build, only the assets the installer uses. Add --onedir to skip unpacking on every launch
+python build_installer.py %*
+pause
\ No newline at end of file
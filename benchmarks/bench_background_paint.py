@@ -0,0 +1,69 @@
+"""Measure repaint cost of the installer's background widgets.
+
+Compares the old paintEvent, which smooth-scaled the background JPEG on every repaint, with
+ScaledBackgroundWidget, which scales once per size and blits the cached pixmap afterwards.
+Runs offscreen, so no window is shown.
+
+    python benchmarks/bench_background_paint.py --repaints 200
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def load_installer():
+    spec = importlib.util.spec_from_file_location("mickfx_plugin_installer", os.path.join(ROOT, "mickfx-plugin-installer.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run(label, widget, image, repaints):
+    start = time.perf_counter()
+    for _ in range(repaints):
+        widget.render(image)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {elapsed * 1000 / repaints:8.3f} ms per repaint")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repaints", type=int, default=200)
+    parser.add_argument("--width", type=int, default=600)
+    parser.add_argument("--height", type=int, default=600)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.chdir(ROOT)
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QImage, QPainter
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    installer = load_installer()
+
+    class UncachedBackground(installer.ScaledBackgroundWidget):
+        image_name = "MickFX Background2.jpg"
+
+        def paintEvent(self, event):
+            painter = QPainter(self)
+            scaled_image = self.background_image.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            painter.drawPixmap(self.rect(), scaled_image)
+
+    image = QImage(args.width, args.height, QImage.Format_ARGB32_Premultiplied)
+    widgets = {}
+    for label, cls in (("scale on every paint", UncachedBackground), ("cached scaled pixmap", installer.ContentBackgroundWidget)):
+        widget = cls()
+        widget.resize(args.width, args.height)
+        widgets[label] = widget
+
+    print(f"{args.repaints} repaints of a {args.width}x{args.height} background")
+    before = run("scale on every paint", widgets["scale on every paint"], image, args.repaints)
+    after = run("cached scaled pixmap", widgets["cached scaled pixmap"], image, args.repaints)
+    print(f"speedup                    {before / after:8.2f}x")
+
+if __name__ == "__main__":
+    main()
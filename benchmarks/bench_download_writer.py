@@ -0,0 +1,100 @@
+"""Compare the old 8 KB iter_content download loop with installer_core's BodyReader.
+
+Both download the same payload from a local stand-in mirror into a file. Reported per run:
+throughput, body reads, file writes (one syscall each) and the chunk objects the loop had to
+allocate. Run it against a payload big enough to matter on a gigabit LAN mirror:
+
+    python benchmarks/bench_download_writer.py --payload-mb 200 --runs 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class MirrorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, payload_size):
+        super().__init__(("127.0.0.1", 0), MirrorHandler)
+        self.payload = memoryview(os.urandom(1024 * 1024) * (payload_size // (1024 * 1024)))
+
+class MirrorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(self.server.payload)))
+        self.end_headers()
+        self.wfile.write(self.server.payload)
+
+    def log_message(self, format, *args):
+        pass
+
+class CountingFile:
+    def __init__(self, file):
+        self.file = file
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return self.file.write(data)
+
+def iter_content_loop(response, file):
+    """The old DownloadWorker loop: a new bytes object and a write per 8 KB"""
+    reads = allocations = 0
+    for data in response.iter_content(chunk_size=8192):
+        reads += 1
+        allocations += 1
+        file.write(data)
+    return reads, allocations
+
+def body_reader_loop(response, file):
+    from installer_core import BodyReader
+
+    reader = BodyReader(response)
+    for data in reader:
+        file.write(data)
+    # The reusable buffer is the only allocation
+    return reader.reads, 1
+
+def run(label, loop, session, url, path, size):
+    with session.get(url, stream=True, timeout=30) as response, open(path, "wb", buffering=0) as raw:
+        file = CountingFile(raw)
+        start = time.perf_counter()
+        reads, allocations = loop(response, file)
+        elapsed = time.perf_counter() - start
+    assert os.path.getsize(path) == size
+    print(f"{label:<14} {size / elapsed / 1024 / 1024:8.1f} MB/s  {reads:7d} reads  {file.writes:7d} writes  "
+          f"{allocations:7d} chunk allocations")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload-mb", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    import requests
+
+    server = MirrorServer(args.payload_mb * 1024 * 1024)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/mirror.zip"
+    session = requests.Session()
+    size = len(server.payload)
+
+    print(f"{args.payload_mb} MB from a local mirror, {args.runs} runs each")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "download.zip")
+        before = min(run("iter_content", iter_content_loop, session, url, path, size) for _ in range(args.runs))
+        after = min(run("BodyReader", body_reader_loop, session, url, path, size) for _ in range(args.runs))
+    print(f"speedup        {before / after:8.2f}x (best runs)")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure connection and redirect overhead of plugin downloads against a local stand-in server.
+
+Compares a fresh requests.get per download (the old DownloadWorker behaviour) with the shared
+HttpSession from installer_core. The stand-in server mimics the forum links: every download URL
+answers with a redirect to the actual file. --handshake-ms adds a delay to every new connection
+to stand in for the TCP+TLS handshake to a remote host.
+
+    python benchmarks/bench_http_session.py --downloads 20 --handshake-ms 60
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, payload_size, handshake_delay):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.payload = os.urandom(payload_size)
+        self.handshake_delay = handshake_delay
+        self.connections = 0
+        self.redirects = 0
+        self.counter_lock = threading.Lock()
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.counter_lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake_delay)
+
+    def do_GET(self):
+        if self.path.startswith("/download/"):
+            with self.server.counter_lock:
+                self.server.redirects += 1
+            self.send_response(303)
+            self.send_header("Location", "/files/" + self.path.rsplit("/", 1)[-1] + ".zip")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(self.server.payload)))
+        self.end_headers()
+        self.wfile.write(self.server.payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def download(get, url):
+    with get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        for _ in response.iter_content(chunk_size=65536):
+            pass
+
+def run(label, get, urls, server):
+    server.connections = server.redirects = 0
+    start = time.perf_counter()
+    for url in urls:
+        download(get, url)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<16} {elapsed * 1000:9.1f} ms  {server.connections:4d} connections  {server.redirects:4d} redirects")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--downloads", type=int, default=20)
+    parser.add_argument("--plugins", type=int, default=5, help="distinct download links, reinstalled in turn")
+    parser.add_argument("--payload-kb", type=int, default=256)
+    parser.add_argument("--handshake-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    import requests
+    from installer_core import HttpSession
+
+    server = StandInServer(args.payload_kb * 1024, args.handshake_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base}/download/{i % args.plugins}" for i in range(args.downloads)]
+
+    print(f"{args.downloads} downloads of {args.payload_kb} KB, {args.handshake_ms:.0f} ms per new connection")
+    before = run("requests.get", requests.get, urls, server)
+    after = run("HttpSession", HttpSession().get, urls, server)
+    print(f"speedup          {before / after:9.2f}x")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
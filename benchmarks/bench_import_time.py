@@ -0,0 +1,64 @@
+"""Report what importing the installer costs before the window can be built, via -X importtime.
+
+Imports mickfx-plugin-installer.py (without starting the GUI) in fresh interpreters, drops the
+modules the bare interpreter already loads and prints the median total plus the slowest
+top-level imports. Modules that should only load on first use are listed separately and the
+run fails if one of them is imported eagerly.
+
+    python benchmarks/bench_import_time.py --runs 5 --top 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "mickfx-plugin-installer.py")
+LOAD = ("import importlib.util, sys; sys.path.insert(0, {root!r}); "
+        "spec = importlib.util.spec_from_file_location('installer', {script!r}); "
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))")
+# Loaded on first use only, see the import comments in mickfx-plugin-installer.py and installer_core.py
+LAZY = ("PyQt5.QtMultimedia", "requests", "zipfile", "urllib3", "hashlib", "json")
+
+def import_times(code):
+    """{module: (self us, cumulative us, depth)} for one fresh interpreter running code"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, cwd=ROOT)
+    if result.returncode:
+        sys.exit(result.stderr)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(self_us), int(cumulative), depth)
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    baseline = set(import_times("pass"))
+    totals = []
+    for _ in range(args.runs):
+        times = {name: t for name, t in import_times(LOAD.format(root=ROOT, script=SCRIPT)).items()
+                 if name not in baseline}
+        totals.append(sum(self_us for self_us, _, _ in times.values()))
+
+    print(f"{len(times)} modules imported, median {statistics.median(totals) / 1000:.1f} ms "
+          f"over {args.runs} runs (min {min(totals) / 1000:.1f} ms)")
+    print(f"\nslowest top-level imports (last run)")
+    top_level = sorted(((cumulative, name) for name, (_, cumulative, depth) in times.items() if depth == 0), reverse=True)
+    for cumulative, name in top_level[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    eager = [name for name in LAZY if name in times]
+    print(f"\nlazy modules imported eagerly: {', '.join(eager) if eager else 'none'}")
+    return 1 if eager else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
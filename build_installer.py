@@ -0,0 +1,110 @@
+"""Slim PyInstaller build of the installer that bundles only the assets the code references.
+
+An asset in MickFX Required Sources is bundled when its file name appears in the installer's
+source, anything else (unused logos, the WebM logo...) is left out. Prints a size report of
+the bundled assets before building and of the biggest bundle contributors afterwards.
+
+    python build_installer.py              one exe, unpacked to a temp folder on every launch
+    python build_installer.py --onedir     a folder with the exe, nothing unpacked on launch
+    python build_installer.py --console    a console exe for --headless installs from scripts
+    python build_installer.py --report     asset report only, no build
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = "mickfx-plugin-installer.py"
+SOURCES = (SCRIPT, "installer_core.py")
+ASSETS = "MickFX Required Sources"
+NAME = "MickFX Plugin Installer"
+ICON = "Mick Logo.ico"
+# Modules the installer never imports but PyInstaller can pick up through optional imports
+EXCLUDES = ("tkinter", "unittest", "pydoc", "doctest", "lib2to3", "xmlrpc", "sqlite3",
+            "PyQt5.QtQml", "PyQt5.QtQuick", "PyQt5.QtSql", "PyQt5.QtTest", "PyQt5.QtXml",
+            "PyQt5.QtWebEngineWidgets", "PyQt5.QtWebEngineCore", "PyQt5.QtBluetooth", "PyQt5.QtDBus")
+
+def referenced_assets():
+    """(bundled, left out) lists of (name, size), bundled ones are named in the source"""
+    source = ""
+    for name in SOURCES:
+        with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+            source += f.read()
+    bundled, left_out = [], []
+    for name in sorted(os.listdir(os.path.join(ROOT, ASSETS))):
+        size = os.path.getsize(os.path.join(ROOT, ASSETS, name))
+        (bundled if f'"{name}"' in source or f"'{name}'" in source else left_out).append((name, size))
+    return bundled, left_out
+
+def print_sizes(title, entries, limit=None):
+    total = sum(size for _, size in entries)
+    print(f"\n{title}: {len(entries)} files, {total / 1024:.0f} KB")
+    for name, size in sorted(entries, key=lambda entry: -entry[1])[:limit]:
+        print(f"  {size / 1024:9.0f} KB  {size / max(total, 1):6.1%}  {name}")
+    return total
+
+def bundle_contents(path):
+    """(name, size) of every file in a built onedir folder or onefile exe"""
+    if os.path.isdir(path):
+        contents = []
+        for folder, _, files in os.walk(path):
+            for name in files:
+                full = os.path.join(folder, name)
+                contents.append((os.path.relpath(full, path), os.path.getsize(full)))
+        return contents
+    from PyInstaller.archive.readers import CArchiveReader
+    # toc entries are (offset, compressed size, size, compressed?, type), the exe stores compressed sizes
+    return [(name, entry[1]) for name, entry in CArchiveReader(path).toc.items()]
+
+def group_contents(contents):
+    """Sum Qt plugin folders and the bundled assets per folder, everything else per file"""
+    groups = {}
+    for name, size in contents:
+        parts = name.replace("\\", "/").split("/")
+        if "plugins" in parts[:-1]:
+            name = "/".join(parts[:parts.index("plugins") + 2]) + "/"
+        elif "translations" in parts[:-1]:
+            name = "/".join(parts[:parts.index("translations") + 1]) + "/"
+        groups[name] = groups.get(name, 0) + size
+    return list(groups.items())
+
+def build(assets, onedir, console=False):
+    # The console build has working stdout/stderr and cmd.exe waits for it like any console program
+    name = NAME + " Console" if console else NAME
+    command = [sys.executable, "-m", "PyInstaller", "--clean", "--noconfirm", "--console" if console else "--windowed",
+               "--noupx", "--optimize=2", "--name", name, "--onedir" if onedir else "--onefile"]
+    if os.path.exists(os.path.join(ROOT, ICON)):
+        command += ["--icon", ICON]
+    for name, _ in assets:
+        command += ["--add-data", f"{os.path.join(ASSETS, name)}{os.pathsep}{ASSETS}"]
+    for module in EXCLUDES:
+        command += ["--exclude-module", module]
+    subprocess.run(command + [SCRIPT], cwd=ROOT, check=True)
+    return os.path.join(ROOT, "dist", name if onedir else name + (".exe" if os.name == "nt" else ""))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--onedir", action="store_true", help="build a folder instead of a single exe")
+    parser.add_argument("--console", action="store_true", help="build a console exe for --headless installs")
+    parser.add_argument("--report", action="store_true", help="only print the asset report")
+    parser.add_argument("--budget-mb", type=float, default=3.0, help="warn when the bundle is bigger")
+    parser.add_argument("--top", type=int, default=20, help="bundle contributors to list")
+    args = parser.parse_args()
+
+    bundled, left_out = referenced_assets()
+    print_sizes("Bundled assets", bundled)
+    print_sizes("Left out (not referenced in the source)", left_out)
+    if args.report:
+        return 0
+
+    output = build(bundled, args.onedir, args.console)
+    total = print_sizes(f"Bundle contributors in {os.path.relpath(output, ROOT)}",
+                        group_contents(bundle_contents(output)), args.top)
+    budget = args.budget_mb * 1024 * 1024
+    if total > budget:
+        print(f"\nOver the {args.budget_mb:g} MB budget by {(total - budget) / 1024 / 1024:.1f} MB")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
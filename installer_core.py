@@ -0,0 +1,1558 @@
+"""Qt-free helpers shared by the installer window and its download workers."""
+import contextlib
+import functools
+import os
+import struct
+import threading
+import time
+
+# How many plugin archives may download at the same time ("Install All Missing")
+MAX_PARALLEL_DOWNLOADS = max(1, int(os.environ.get("MICKFX_MAX_DOWNLOADS", "4")))
+# Connections kept alive per host, one for each parallel download
+POOL_MAXSIZE = MAX_PARALLEL_DOWNLOADS
+# Seconds a request waits for one of those connections to come free before failing
+POOL_TIMEOUT = 600
+# Per-user data that is never shared between machines
+LOCAL_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"), "MickFX")
+# Plugin archives are kept here between runs, point it at a network share to share one cache between machines
+CACHE_DIR = os.environ.get("MICKFX_CACHE_DIR") or os.path.join(LOCAL_DIR, "cache")
+# Parsed manifests, kept out of CACHE_DIR because they are loaded without being parsed again
+MANIFEST_CACHE_DIR = os.path.join(LOCAL_DIR, "manifests")
+# Least recently used archives are evicted once the cache grows past this size
+CACHE_MAX_BYTES = int(os.environ.get("MICKFX_CACHE_MAX_MB", "512")) * 1024 * 1024
+# Forum and GitHub downloads redirect to signed URLs that expire, so temporary redirects are only trusted briefly
+REDIRECT_TTL = 300
+
+class HttpSession:
+    """Keep-alive session shared by every DownloadWorker.
+
+    All workers go through one requests.Session so the TCP+TLS connections to obsproject.com and
+    github.com are reused between downloads. The urllib3 pool behind the adapter is thread safe and
+    blocks once a host has POOL_MAXSIZE connections in use, which acts as the per-host limit, for
+    at most pool_timeout seconds so a connection that is never returned can't hang a download.
+    Redirect chains are remembered so a repeated download goes straight to the final location.
+    """
+    def __init__(self, pool_maxsize=POOL_MAXSIZE, redirect_ttl=REDIRECT_TTL, pool_timeout=POOL_TIMEOUT):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize, pool_block=True)
+        # requests never passes a pool timeout to urllib3, which then waits forever
+        adapter.poolmanager.pool_classes_by_scheme = {
+            "http": _with_pool_timeout(HTTPConnectionPool, pool_timeout),
+            "https": _with_pool_timeout(HTTPSConnectionPool, pool_timeout),
+        }
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.redirect_ttl = redirect_ttl
+        self._redirects = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, url):
+        """Return the cached final location for url, or url itself"""
+        with self._lock:
+            cached = self._redirects.get(url)
+            if cached is None:
+                return url
+            location, expires = cached
+            if expires is not None and expires < time.monotonic():
+                del self._redirects[url]
+                return url
+            return location
+
+    def forget(self, url):
+        with self._lock:
+            self._redirects.pop(url, None)
+
+    def get(self, url, **kwargs):
+        import requests
+
+        target = self.resolve(url)
+        if target == url:
+            response = self.session.get(url, **kwargs)
+        else:
+            try:
+                response = self.session.get(target, **kwargs)
+                if response.status_code >= 400:
+                    response.close()
+                    response = None
+            except requests.RequestException:
+                response = None
+            if response is None:
+                # The cached location went stale, follow the original link again
+                self.forget(url)
+                response = self.session.get(url, **kwargs)
+
+        if response.history:
+            permanent = all(r.status_code in (301, 308) for r in response.history)
+            expires = None if permanent else time.monotonic() + self.redirect_ttl
+            with self._lock:
+                self._redirects[url] = (response.url, expires)
+        return response
+
+def _with_pool_timeout(pool_class, timeout):
+    """Subclass of a urllib3 pool class whose requests wait at most timeout seconds for a connection"""
+    class Pool(pool_class):
+        def urlopen(self, *args, pool_timeout=timeout, **kwargs):
+            return super().urlopen(*args, pool_timeout=pool_timeout, **kwargs)
+
+    Pool.__name__ = Pool.__qualname__ = pool_class.__name__
+    return Pool
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Return the process-wide HttpSession, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = HttpSession()
+        return _session
+
+class InstallCancelled(Exception):
+    """The user cancelled the install"""
+
+def check_cancelled(cancel):
+    if cancel is not None and cancel.is_set():
+        raise InstallCancelled()
+
+# Automatic attempts per download, each one resuming from the bytes already on disk
+DOWNLOAD_ATTEMPTS = 3
+# How often the partial download state is written while bytes are streaming in
+PARTIAL_STATE_INTERVAL = 1024 * 1024
+
+# Response bodies are read in chunks that start at READ_CHUNK_MIN and adapt to the throughput,
+# aiming for one read every READ_TARGET_SECONDS
+READ_CHUNK_MIN = 64 * 1024
+READ_CHUNK_MAX = 4 * 1024 * 1024
+READ_TARGET_SECONDS = 0.05
+
+def _http_client_response(raw):
+    """The http.client response under a urllib3 2.x response, or None.
+
+    Reading from it directly fills the buffer straight from the socket, where urllib3's public
+    readinto copies every chunk through a new bytes object first. It is a private attribute, so
+    this is only used for the urllib3 major version it was written against and when it really is
+    an http.client response, BodyReader falls back to raw.readinto otherwise.
+    """
+    import http.client
+    import urllib3
+
+    if not urllib3.__version__.startswith("2."):
+        return None
+    fp = getattr(raw, "_fp", None)
+    return fp if isinstance(fp, http.client.HTTPResponse) else None
+
+class BodyReader:
+    """Reads a streamed response body into one preallocated buffer with readinto.
+
+    Iterating yields memoryviews of that buffer, which are only valid until the next one, so
+    nothing is allocated per chunk. The read size doubles while reads come back full and fast
+    and halves when one takes much longer than READ_TARGET_SECONDS, so a LAN mirror is read in
+    a few large reads while a slow link still reports progress and notices a cancel quickly.
+    Bodies with a Content-Encoding go through requests' decoding in READ_CHUNK_MIN chunks.
+    """
+    def __init__(self, response, min_size=READ_CHUNK_MIN, max_size=READ_CHUNK_MAX):
+        self.response = response
+        self.min_size = min_size
+        self.max_size = max_size
+        self.size = min_size
+        self.reads = 0
+
+    def __iter__(self):
+        if self.response.headers.get("Content-Encoding", "identity").lower() != "identity":
+            for data in self.response.iter_content(chunk_size=self.min_size):
+                self.reads += 1
+                yield data
+            return
+
+        raw = self.response.raw
+        fp = _http_client_response(raw)
+        source = fp.readinto if fp is not None else raw.readinto
+        view = memoryview(bytearray(self.max_size))
+        while True:
+            start = time.perf_counter()
+            count = self._readinto(source, view[:self.size])
+            if not count:
+                break
+            self.reads += 1
+            elapsed = time.perf_counter() - start
+            if count == self.size and elapsed < READ_TARGET_SECONDS / 2:
+                self.size = min(self.size * 2, self.max_size)
+            elif elapsed > READ_TARGET_SECONDS * 2:
+                self.size = max(self.size // 2, self.min_size)
+            yield view[:count]
+
+        # Hand the connection back to the pool only when the body provably ended where the server
+        # said it would. Anything else (cut short, or read until the server closed) is left for
+        # response.close() to close instead of being reused.
+        if fp is not None:
+            complete = fp.length == 0 or (fp.chunked and fp.isclosed())
+        else:
+            complete = raw.length_remaining == 0 or raw.chunked
+        if complete:
+            raw.release_conn()
+
+    @staticmethod
+    def _readinto(source, view):
+        import http.client
+        import requests
+        from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+        # Raise what iter_content would, so download_file retries both paths the same way
+        try:
+            return source(view)
+        except (ProtocolError, http.client.IncompleteRead) as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except (ReadTimeoutError, OSError) as e:
+            # Socket timeouts and resets
+            raise requests.ConnectionError(e)
+
+# Progress of one download is passed on at most this many times per second
+PROGRESS_MAX_RATE = 30
+
+class ProgressThrottle:
+    """Coalesces the per-chunk progress of one download into at most max_rate updates a second.
+
+    Calls callback(current, total, bytes_per_second, eta_seconds) with the latest values, eta is
+    -1 while unknown. The first and the final update (current == total) are always passed on,
+    flush() passes on one that was held back, for downloads of unknown size. The throughput is
+    measured between updates and smoothed so it follows the recent rate without jumping around.
+    """
+    def __init__(self, callback, max_rate=PROGRESS_MAX_RATE, smoothing=0.3):
+        self.callback = callback
+        self.interval = 1.0 / max_rate
+        self.smoothing = smoothing
+        self.rate = 0.0
+        self._last_time = None
+        self._last_current = 0
+        self._pending = None
+
+    def __call__(self, current, total):
+        now = time.monotonic()
+        if (self._last_time is not None and now - self._last_time < self.interval
+                and not (total and current >= total)):
+            self._pending = (current, total)
+            return
+        self._deliver(current, total, now)
+
+    def flush(self):
+        if self._pending:
+            self._deliver(*self._pending, time.monotonic())
+
+    def _deliver(self, current, total, now):
+        if self._last_time is not None and now > self._last_time and current >= self._last_current:
+            sample = (current - self._last_current) / (now - self._last_time)
+            self.rate = sample if not self.rate else self.rate + self.smoothing * (sample - self.rate)
+        self._last_time = now
+        self._last_current = current
+        self._pending = None
+        eta = (total - current) / self.rate if total and self.rate > 0 else -1.0
+        self.callback(current, total, self.rate, eta)
+
+class IntegrityError(Exception):
+    """A download doesn't match the size or sha256 declared in the manifest"""
+
+class DownloadVerifier:
+    """Checks a download against its declared size and sha256 while the bytes stream in.
+
+    The hash is updated with every chunk as it is written, so verifying needs no second read of
+    the file. A download that goes past the declared size fails on the chunk that crosses it.
+    The hash is computed even without a declared one, the download cache names archives by it.
+    """
+    def __init__(self, url, sha256=None, size=None):
+        self.url = url
+        self.expected_sha256 = sha256
+        self.expected_size = size
+        self.sha256 = None
+        self.reset()
+
+    def reset(self):
+        import hashlib
+
+        self.digest = hashlib.sha256()
+        self.position = 0
+
+    def check_total(self, total):
+        """Fail before streaming if the server announces a different size"""
+        if total and self.expected_size is not None and total != self.expected_size:
+            raise IntegrityError(f"{self.url} is {total} bytes, the manifest says {self.expected_size}")
+
+    def write(self, data):
+        self.position += len(data)
+        if self.expected_size is not None and self.position > self.expected_size:
+            raise IntegrityError(f"{self.url} is larger than the {self.expected_size} bytes the manifest says")
+        self.digest.update(data)
+
+    def finish(self):
+        """Check the complete download and return its sha256"""
+        if self.expected_size is not None and self.position != self.expected_size:
+            raise IntegrityError(f"{self.url} is {self.position} bytes, the manifest says {self.expected_size}")
+        sha256 = self.digest.hexdigest()
+        if self.expected_sha256 and sha256 != self.expected_sha256:
+            raise IntegrityError(f"{self.url} has sha256 {sha256}, the manifest says {self.expected_sha256}")
+        self.sha256 = sha256
+        return sha256
+
+def _load_partial_state(state_path, part_path, url):
+    """Return the saved state of an earlier partial download of url, or None if it can't be resumed"""
+    import json
+
+    try:
+        with open(state_path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+        offset = int(state.get("offset", 0))
+        if state.get("url") != url or offset <= 0 or os.path.getsize(part_path) < offset:
+            return None
+    except (OSError, ValueError, AttributeError):
+        return None
+    # Weak ETags can't be used with If-Range, fall back to Last-Modified
+    etag = state.get("etag")
+    validator = etag if etag and not etag.startswith("W/") else state.get("last_modified")
+    if not validator:
+        return None
+    state["validator"] = validator
+    return state
+
+def _save_partial_state(state_path, state):
+    import json
+
+    temp_path = state_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump({key: state[key] for key in ("url", "etag", "last_modified", "offset", "total")}, file)
+    os.replace(temp_path, state_path)
+
+def _discard_partial(part_path, state_path):
+    for path in (part_path, state_path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def _download_attempt(url, part_path, state_path, progress, sink, cancel, verifier):
+    import requests
+
+    state = _load_partial_state(state_path, part_path, url)
+    headers = {}
+    if state:
+        headers["Range"] = f"bytes={state['offset']}-"
+        headers["If-Range"] = state["validator"]
+
+    response = get_session().get(url, stream=True, timeout=30, headers=headers)
+    if state and response.status_code == 416:
+        # The partial file no longer matches what the server has, start over. The retry needs a
+        # connection of its own, so give this one back to the pool first
+        response.close()
+        _discard_partial(part_path, state_path)
+        return _download_attempt(url, part_path, state_path, progress, sink, cancel, verifier)
+    with response:
+        response.raise_for_status()
+
+        length = int(response.headers.get('content-length', 0))
+        if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+            # Content-Length counts the encoded bytes, the size of the file itself is unknown
+            length = 0
+        if state and response.status_code == 206:
+            offset = state["offset"]
+            total = offset + length if length else 0
+        else:
+            # The server ignored the range (or the file changed), download everything again
+            offset = 0
+            total = length
+        verifier.check_total(total)
+
+        state = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "offset": offset,
+            "total": total,
+        }
+        with open(part_path, "r+b" if offset else "wb") as file:
+            file.seek(offset)
+            file.truncate()
+            if total > offset:
+                # Reserve the whole file up front so it isn't grown (and fragmented) chunk by chunk
+                file.truncate(total)
+            if verifier.position > offset:
+                verifier.reset()
+            if sink is not None and sink.active and sink.position > offset:
+                sink.abandon("the download restarted from the beginning")
+            readers = [reader for reader in (verifier, sink)
+                       if reader is not None and getattr(reader, "active", True) and reader.position < offset]
+            if readers:
+                # Resuming a download the verifier or sink hasn't seen the start of (e.g. from an
+                # earlier run), catch them up from disk in one pass
+                position = min(reader.position for reader in readers)
+                file.seek(position)
+                while position < offset:
+                    block = file.read(min(1024 * 1024, offset - position))
+                    if not block:
+                        break
+                    for reader in readers:
+                        if getattr(reader, "active", True) and reader.position < position + len(block):
+                            reader.write(block[reader.position - position:])
+                    position += len(block)
+                file.seek(offset)
+            downloaded_size = offset
+            saved_size = offset
+            try:
+                for data in BodyReader(response):
+                    check_cancelled(cancel)
+                    verifier.write(data)
+                    downloaded_size += file.write(data)
+                    if sink is not None:
+                        sink.write(data)
+                    if progress:
+                        progress(downloaded_size, total)
+                    if downloaded_size - saved_size >= PARTIAL_STATE_INTERVAL:
+                        file.flush()
+                        state["offset"] = saved_size = downloaded_size
+                        _save_partial_state(state_path, state)
+            finally:
+                file.flush()
+                state["offset"] = downloaded_size
+                _save_partial_state(state_path, state)
+
+        if total and downloaded_size < total:
+            raise requests.ConnectionError(f"Connection closed after {downloaded_size} of {total} bytes")
+
+def download_file(url, output_path, progress=None, attempts=DOWNLOAD_ATTEMPTS, sink=None, cancel=None, verifier=None):
+    """Download url to output_path, resuming interrupted transfers with HTTP range requests.
+
+    Bytes are written to output_path + ".part" next to a small JSON sidecar holding the ETag or
+    Last-Modified validator and the byte offset reached so far. A later call for the same url
+    continues from that offset with an If-Range request, and the server sends the whole file again
+    if it changed or doesn't support ranges. Connection failures are retried automatically.
+
+    If given, sink.write() receives the file's bytes in order as they arrive (see StreamingExtractor).
+    Setting the cancel event stops the download with InstallCancelled, keeping the partial file.
+    The bytes are checked by verifier (a DownloadVerifier for url by default) as they arrive, a
+    download failing the check raises IntegrityError and its partial file is discarded.
+    """
+    import requests
+
+    verifier = verifier or DownloadVerifier(url)
+    part_path = output_path + ".part"
+    state_path = part_path + ".json"
+    try:
+        for attempt in range(1, attempts + 1):
+            try:
+                _download_attempt(url, part_path, state_path, progress, sink, cancel, verifier)
+                break
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+                if attempt == attempts:
+                    raise
+                time.sleep(min(2 ** attempt, 10))
+        verifier.finish()
+    except IntegrityError:
+        _discard_partial(part_path, state_path)
+        raise
+
+    os.replace(part_path, output_path)
+    _discard_partial(part_path, state_path)
+    return output_path
+
+class DownloadCache:
+    """Size-bounded, content-addressed store of downloaded plugin archives.
+
+    Archives are stored as objects/<sha256>.zip and index.json maps each download URL to the hash
+    of the archive it served. Looking an archive up by hash skips the index entirely, so a cache
+    can be pre-seeded by copying archives (or a whole cache folder) into place. The modification
+    time of each object is its last use, which keeps LRU eviction working when several machines
+    share the folder. Every write is a rename of a finished file, so readers never see a partial one.
+    """
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        self._partial_dir = None
+        # Objects whose content was hashed by this process, with the (size, mtime) they had then
+        self._verified = {}
+
+    @property
+    def partial_dir(self):
+        """Folder for downloads in progress, on the same volume as the cache so storing is a rename"""
+        if self._partial_dir is None:
+            import tempfile
+
+            self._partial_dir = os.path.join(self.root, "partial")
+            try:
+                os.makedirs(self._partial_dir, exist_ok=True)
+            except OSError:
+                # Read-only cache (e.g. a shared mount), keep downloads local instead
+                self._partial_dir = os.path.join(tempfile.gettempdir(), "MickFX", "partial")
+                os.makedirs(self._partial_dir, exist_ok=True)
+        return self._partial_dir
+
+    def _object_path(self, sha256):
+        return os.path.join(self.objects_dir, f"{sha256}.zip")
+
+    def _read_index(self):
+        import json
+
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        import json
+
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(index, file, indent=1, sort_keys=True)
+        os.replace(temp_path, self.index_path)
+
+    def lookup(self, url, sha256=None, size=None):
+        """Return the cached archive for url (or for sha256 when known), or None.
+
+        Pre-seeded and shared caches aren't trusted blindly: an archive is checked against the
+        sha256 it is named after (the declared one when looking up by sha256) and the declared
+        size, and one that doesn't match is deleted and reported as a miss. An archive is only
+        hashed again when its size or modification time changed since this process last checked it.
+        """
+        with self._lock:
+            if sha256 is None:
+                sha256 = self._read_index().get(url)
+        if not sha256:
+            return None
+        path = self._object_path(sha256)
+        try:
+            if not self._matches(path, sha256, size):
+                print(f"Discarding cached archive {path}, its content doesn't match its name or the plugin manifest")
+                self._verified.pop(path, None)
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+                return None
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            # Read-only cache, still usable without LRU bookkeeping
+            if not os.path.exists(path):
+                return None
+        if path in self._verified:
+            # Touching it for LRU changed its modification time, it's still the file that was checked
+            self._verified[path] = self._stat_key(path)
+        return path
+
+    @staticmethod
+    def _stat_key(path):
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _matches(self, path, sha256, size):
+        import hashlib
+
+        key = self._stat_key(path)
+        if size is not None and key[0] != size:
+            return False
+        if self._verified.get(path) == key:
+            return True
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        if digest.hexdigest() != sha256:
+            return False
+        self._verified[path] = key
+        return True
+
+    def store(self, url, path, sha256=None):
+        """Move a downloaded archive into the cache and return its new path.
+
+        Returns path unchanged if the cache can't be written to.
+        """
+        import hashlib
+        import shutil
+
+        if sha256 is None:
+            digest = hashlib.sha256()
+            with open(path, "rb") as file:
+                for block in iter(lambda: file.read(1024 * 1024), b""):
+                    digest.update(block)
+            sha256 = digest.hexdigest()
+
+        with self._lock:
+            try:
+                os.makedirs(self.objects_dir, exist_ok=True)
+                cached_path = self._object_path(sha256)
+                if os.path.exists(cached_path):
+                    os.remove(path)
+                    os.utime(cached_path)
+                else:
+                    temp_path = f"{cached_path}.{os.getpid()}.tmp"
+                    shutil.move(path, temp_path)
+                    os.replace(temp_path, cached_path)
+                    # Its hash was just computed from the same bytes
+                    self._verified[cached_path] = self._stat_key(cached_path)
+
+                index = self._read_index()
+                index[url] = sha256
+                self._write_index(index)
+                self._evict(keep=cached_path)
+                return cached_path
+            except OSError as e:
+                print(f"Could not store {url} in the download cache: {e}")
+                return path
+
+    def _evict(self, keep):
+        entries = []
+        with os.scandir(self.objects_dir) as scan:
+            for entry in scan:
+                if entry.name.endswith(".zip") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def fetch(self, url, name, progress=None, sha256=None, size=None, sink=None, cancel=None):
+        """Return a local path to the archive behind url, downloading it only on a cache miss.
+
+        Downloads are checked against sha256 and size if given, see DownloadVerifier.
+        """
+        cached_path = self.lookup(url, sha256, size)
+        if cached_path:
+            if progress:
+                cached_size = os.path.getsize(cached_path)
+                progress(cached_size, cached_size)
+            return cached_path
+
+        verifier = DownloadVerifier(url, sha256, size)
+        output_path = download_file(url, os.path.join(self.partial_dir, f"{name}.zip"), progress,
+                                    sink=sink, cancel=cancel, verifier=verifier)
+        return self.store(url, output_path, verifier.sha256)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """Return the process-wide DownloadCache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DownloadCache()
+        return _cache
+
+class StreamingUnsupported(Exception):
+    """The archive uses a zip feature that can't be extracted front to back"""
+
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+
+def member_path(destination, name):
+    """Return where zip member name goes below destination, sanitised the same way zipfile does it"""
+    arcname = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [part for part in arcname.split(os.path.sep) if part not in ("", os.path.curdir, os.path.pardir)]
+    if os.path.sep == "\\":
+        table = str.maketrans(':<>|"?*', "_______")
+        parts = [part.translate(table).rstrip(".") or "_" for part in parts]
+    return os.path.join(destination, *parts)
+
+def file_matches(path, size, crc):
+    """True if path already holds size bytes with this CRC32, e.g. from an earlier install"""
+    import zlib
+
+    try:
+        if not os.path.isfile(path) or os.path.getsize(path) != size:
+            return False
+        value = 0
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                value = zlib.crc32(block, value)
+        return value == crc
+    except OSError:
+        return False
+
+class _StreamEntry:
+    def __init__(self, name, path, method, flags, crc, size, compressed_size, zip64, journal, unchanged=False):
+        import zlib
+
+        self.name = name
+        # Still inflated so the archive's CRC is checked, but not written
+        self.unchanged = unchanged
+        self.path = path
+        self.is_directory = name.endswith("/")
+        self.has_descriptor = bool(flags & 0x8)
+        self.expected_crc = crc
+        self.expected_size = size
+        self.remaining = compressed_size
+        self.zip64 = zip64
+        self.decompressor = zlib.decompressobj(-15) if method == 8 else None
+        self.awaiting_descriptor = False
+        self.crc = 0
+        self.size = 0
+        self.file = None
+        self.journal = journal
+
+    def write(self, data):
+        import zlib
+
+        if self.is_directory:
+            self.journal.make_dirs(self.path)
+        elif not self.unchanged:
+            if self.file is None:
+                self.file = open(self.journal.prepare(self.path), "wb")
+            self.file.write(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class StreamingExtractor:
+    """Extracts zip entries into destination while the archive is still downloading.
+
+    A zip can be read front to back through the local header in front of every entry, so each
+    entry is inflated and written as soon as its bytes arrive and checked against its CRC. The
+    archive's central directory at the end is what marks the stream as complete. When an archive
+    can't be streamed (stored entries whose size only follows the data, encryption, unusual
+    compression) or anything goes wrong, the extractor stops quietly. Entries it did finish are
+    listed in extracted, and extract_archive() extracts the rest from the finished file.
+    Entries are written through journal (an InstallJournal), they are in place once it commits.
+    When incremental, entries whose file already matches their size and CRC32 aren't written.
+    """
+    def __init__(self, destination, journal=None, incremental=False):
+        self.destination = destination
+        self.journal = journal or InstallJournal(destination)
+        self.incremental = incremental
+        self.position = 0
+        self.active = True
+        self.complete = False
+        self.extracted = set()
+        self._buffer = bytearray()
+        self._entry = None
+
+    def abandon(self, reason):
+        if self.active:
+            print(f"Streaming extraction stopped, extracting after the download instead: {reason}")
+        self.close()
+
+    def close(self):
+        self.active = False
+        if self._entry is not None:
+            self._entry.close()
+            if not self._entry.unchanged and not self._entry.is_directory:
+                # Stopped part way through the entry, extract_archive() writes it again from the file
+                self.journal.unstage(self._entry.path)
+            self._entry = None
+        self._buffer = bytearray()
+
+    def write(self, data):
+        if not self.active:
+            return
+        self.position += len(data)
+        if self.complete:
+            return
+        self._buffer += data
+        try:
+            while not self.complete:
+                if self._entry is None:
+                    progressed = self._read_header()
+                elif self._entry.awaiting_descriptor:
+                    progressed = self._read_descriptor()
+                else:
+                    progressed = self._read_data()
+                if not progressed:
+                    break
+        except Exception as e:
+            self.abandon(e)
+
+    def _read_header(self):
+        import zipfile
+
+        buffer = self._buffer
+        if len(buffer) < 4:
+            return False
+        signature = bytes(buffer[:4])
+        if signature in (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06"):
+            # Reached the central directory, every entry has been seen
+            self.complete = True
+            self._buffer = bytearray()
+            return False
+        if signature != b"PK\x03\x04":
+            raise StreamingUnsupported("unexpected data between entries")
+        if len(buffer) < _LOCAL_HEADER.size:
+            return False
+        (_, _, flags, method, _, _, crc, compressed_size, size,
+         name_length, extra_length) = _LOCAL_HEADER.unpack_from(buffer)
+        header_size = _LOCAL_HEADER.size + name_length + extra_length
+        if len(buffer) < header_size:
+            return False
+
+        raw_name = bytes(buffer[_LOCAL_HEADER.size:_LOCAL_HEADER.size + name_length])
+        extra = bytes(buffer[_LOCAL_HEADER.size + name_length:header_size])
+        del buffer[:header_size]
+
+        if flags & 0x1:
+            raise StreamingUnsupported("encrypted entry")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise StreamingUnsupported(f"compression method {method}")
+        if flags & 0x8 and method == zipfile.ZIP_STORED:
+            raise StreamingUnsupported("stored entry without a size")
+
+        zip64 = False
+        if size == 0xFFFFFFFF or compressed_size == 0xFFFFFFFF:
+            zip64 = True
+            size, compressed_size = self._zip64_sizes(extra, size, compressed_size)
+
+        name = raw_name.decode("utf-8" if flags & 0x800 else "cp437")
+        path = member_path(self.destination, name)
+        # Entries followed by a data descriptor only give their CRC after the data, those are
+        # staged and dropped again in _finish_entry if they turn out to match
+        unchanged = (self.incremental and not flags & 0x8 and not name.endswith("/")
+                     and file_matches(path, size, crc))
+        if unchanged:
+            self.journal.skip(path, size)
+        self._entry = _StreamEntry(name, path, method, flags, crc, size, compressed_size, zip64, self.journal, unchanged)
+        if method == zipfile.ZIP_STORED and compressed_size == 0:
+            self._entry.write(b"")
+            self._finish_entry()
+        return True
+
+    @staticmethod
+    def _zip64_sizes(extra, size, compressed_size):
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, length = struct.unpack_from("<HH", extra, offset)
+            if header_id == 0x0001:
+                fields = extra[offset + 4:offset + 4 + length]
+                values = list(struct.unpack_from(f"<{len(fields) // 8}Q", fields))
+                if size == 0xFFFFFFFF and values:
+                    size = values.pop(0)
+                if compressed_size == 0xFFFFFFFF and values:
+                    compressed_size = values.pop(0)
+                return size, compressed_size
+            offset += 4 + length
+        raise StreamingUnsupported("zip64 entry without sizes")
+
+    def _read_data(self):
+        entry = self._entry
+        if not self._buffer:
+            return False
+        if entry.decompressor is not None:
+            data = entry.decompressor.decompress(self._buffer)
+            finished = entry.decompressor.eof
+            self._buffer = bytearray(entry.decompressor.unused_data) if finished else bytearray()
+        else:
+            take = min(entry.remaining, len(self._buffer))
+            data = bytes(self._buffer[:take])
+            del self._buffer[:take]
+            entry.remaining -= take
+            finished = entry.remaining == 0
+        entry.write(data)
+        if finished:
+            if entry.has_descriptor:
+                entry.awaiting_descriptor = True
+            else:
+                self._finish_entry()
+        return True
+
+    def _read_descriptor(self):
+        entry = self._entry
+        buffer = self._buffer
+        if len(buffer) < 4:
+            return False
+        start = 4 if bytes(buffer[:4]) == b"PK\x07\x08" else 0
+        size_format = "<Q" if entry.zip64 else "<I"
+        length = start + 4 + 2 * struct.calcsize(size_format)
+        if len(buffer) < length:
+            return False
+        entry.expected_crc = struct.unpack_from("<I", buffer, start)[0]
+        entry.expected_size = struct.unpack_from(size_format, buffer, length - struct.calcsize(size_format))[0]
+        del buffer[:length]
+        self._finish_entry()
+        return True
+
+    def _finish_entry(self):
+        entry = self._entry
+        self._entry = None
+        entry.close()
+        if entry.crc != entry.expected_crc or entry.size != entry.expected_size:
+            raise ValueError(f"{entry.name} failed its CRC check")
+        if (self.incremental and entry.has_descriptor and not entry.is_directory
+                and file_matches(entry.path, entry.size, entry.crc)):
+            # Its CRC only came with the data descriptor, drop the copy that was staged meanwhile
+            self.journal.unstage(entry.path)
+            self.journal.skip(entry.path, entry.size)
+        self.extracted.add(entry.name)
+
+def extract_archive(zip_path, destination, skip=(), journal=None, cancel=None, incremental=False):
+    """Extract every member of zip_path below destination except those named in skip.
+
+    Members are staged in journal, which the caller commits. Without one the archive is staged
+    and committed here. When incremental, members whose file already matches the size and
+    CRC32 in the central directory are skipped (see InstallJournal.skipped_bytes).
+    """
+    import shutil
+    import zipfile
+
+    if journal is None:
+        journal = InstallJournal(destination)
+        try:
+            extract_archive(zip_path, destination, skip, journal, cancel, incremental)
+        except BaseException:
+            journal.rollback()
+            raise
+        journal.commit()
+        return
+
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        for info in archive.infolist():
+            if info.filename in skip:
+                continue
+            check_cancelled(cancel)
+            path = member_path(destination, info.filename)
+            if info.is_dir():
+                journal.make_dirs(path)
+                continue
+            if incremental and file_matches(path, info.file_size, info.CRC):
+                # Drop a copy staged while streaming, it could be incomplete
+                journal.unstage(path)
+                journal.skip(path, info.file_size)
+                continue
+            with archive.open(info) as source, open(journal.prepare(path), "wb") as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+
+def verify_archive(zip_path):
+    """Check that the archive's central directory is readable and nothing in it is encrypted"""
+    import zipfile
+
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        members = archive.infolist()
+    if not members:
+        raise zipfile.BadZipFile("The archive is empty")
+    for info in members:
+        if info.flag_bits & 0x1:
+            raise zipfile.BadZipFile(f"{info.filename} is encrypted")
+
+# Installs are staged in this folder below the OBS folder, so committing them is a rename
+STAGING_DIR = ".mickfx-staging"
+
+class InstallJournal:
+    """Stages everything an install writes below destination and swaps it in on commit().
+
+    Files are written to .mickfx-staging/<name>/files instead of the live tree, so rolling back
+    a failed or cancelled install only deletes its staging folder. commit() first writes
+    journal.json listing every file it is about to move, then moves the files being replaced into
+    backup/ and renames the staged ones into place. Staging sits on the same volume as the OBS
+    folder, so the whole commit is a batch of renames. A commit that fails half way is undone
+    right away, one cut short by a crash is undone by recover_installs() on the next run.
+    """
+    def __init__(self, destination, name="install"):
+        self.destination = destination
+        self.staging_dir = os.path.join(destination, STAGING_DIR, name)
+        self.journal_path = os.path.join(self.staging_dir, "journal.json")
+        self.dirs = []
+        self.files = []
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+        self._seen = set()
+
+    def skip(self, path, size):
+        """Record that path is already up to date and won't be written"""
+        if path not in self._seen:
+            self._seen.add(path)
+            self.skipped_files += 1
+            self.skipped_bytes += size
+
+    def unstage(self, path):
+        """Forget path and delete its staged copy, if any, so it can be skipped or prepared again"""
+        relative_path = os.path.relpath(path, self.destination)
+        if relative_path in self.files:
+            self.files.remove(relative_path)
+            self._seen.discard(path)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(self.staging_dir, "files", relative_path))
+
+    def make_dirs(self, path):
+        """Call for a directory the install needs, it is created on commit"""
+        if path not in self._seen:
+            self._seen.add(path)
+            self.dirs.append(path)
+
+    def prepare(self, path):
+        """Call before writing path, returns the staging path to write it to instead"""
+        relative_path = os.path.relpath(path, self.destination)
+        staged_path = os.path.join(self.staging_dir, "files", relative_path)
+        if path not in self._seen:
+            self._seen.add(path)
+            self.files.append(relative_path)
+            os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+        return staged_path
+
+    def rollback(self):
+        """Drop the staged files, nothing in the live tree was touched before commit()"""
+        _remove_staging(self.destination, self.staging_dir)
+
+    def commit(self):
+        import json
+
+        # Directories that don't exist yet, parents first
+        created_dirs = set()
+        for path in self.dirs + [os.path.dirname(os.path.join(self.destination, f)) for f in self.files]:
+            while path != self.destination and not os.path.isdir(path) and path not in created_dirs:
+                created_dirs.add(path)
+                path = os.path.dirname(path)
+        journal = {
+            "dirs": sorted((os.path.relpath(path, self.destination) for path in created_dirs), key=len),
+            "files": [{"path": relative_path, "backup": os.path.lexists(os.path.join(self.destination, relative_path))}
+                      for relative_path in self.files],
+        }
+        if not journal["dirs"] and not journal["files"]:
+            # Everything was already up to date
+            _remove_staging(self.destination, self.staging_dir)
+            return
+        os.makedirs(self.staging_dir, exist_ok=True)
+        with open(self.journal_path, "w", encoding="utf-8") as file:
+            json.dump(journal, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        try:
+            for relative_path in journal["dirs"]:
+                os.makedirs(os.path.join(self.destination, relative_path), exist_ok=True)
+            for entry in journal["files"]:
+                path = os.path.join(self.destination, entry["path"])
+                if entry["backup"]:
+                    backup_path = os.path.join(self.staging_dir, "backup", entry["path"])
+                    os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+                    os.replace(path, backup_path)
+                os.replace(os.path.join(self.staging_dir, "files", entry["path"]), path)
+        except BaseException:
+            _undo_commit(self.destination, self.staging_dir, journal)
+            _remove_staging(self.destination, self.staging_dir)
+            raise
+        # Without the journal there is nothing left to undo, this is the point of no return
+        os.remove(self.journal_path)
+        _remove_staging(self.destination, self.staging_dir)
+
+def _undo_commit(destination, staging_dir, journal):
+    """Put back the files a partly done commit replaced and remove the ones it added"""
+    for entry in reversed(journal["files"]):
+        path = os.path.join(destination, entry["path"])
+        staged_path = os.path.join(staging_dir, "files", entry["path"])
+        backup_path = os.path.join(staging_dir, "backup", entry["path"])
+        if os.path.lexists(staged_path):
+            # Not moved in yet, but the original may already have been moved aside
+            if entry["backup"] and os.path.lexists(backup_path) and not os.path.lexists(path):
+                os.replace(backup_path, path)
+        elif entry["backup"]:
+            os.replace(backup_path, path)
+        else:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+    for relative_path in reversed(journal["dirs"]):
+        with contextlib.suppress(OSError):
+            os.rmdir(os.path.join(destination, relative_path))
+
+def _remove_staging(destination, staging_dir):
+    import shutil
+
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    with contextlib.suppress(OSError):
+        os.rmdir(os.path.join(destination, STAGING_DIR))
+
+def recover_installs(destination):
+    """Undo commits cut short by a crash and delete leftover staging folders below destination.
+
+    Must not run while installs into destination are in progress. Returns the names of the
+    installs whose commit was undone.
+    """
+    import json
+
+    root = os.path.join(destination, STAGING_DIR)
+    if not os.path.isdir(root):
+        return []
+    recovered = []
+    with os.scandir(root) as scan:
+        staging_dirs = [(entry.name, entry.path) for entry in scan if entry.is_dir()]
+    for name, staging_dir in staging_dirs:
+        try:
+            with open(os.path.join(staging_dir, "journal.json"), "r", encoding="utf-8") as file:
+                journal = json.load(file)
+        except FileNotFoundError:
+            pass  # Interrupted before its commit, the live tree was never touched
+        except (OSError, ValueError) as e:
+            # Written only partly, so the commit hadn't started moving files yet
+            print(f"Ignoring the unreadable install journal of {name}: {e}")
+        else:
+            _undo_commit(destination, staging_dir, journal)
+            recovered.append(name)
+        _remove_staging(destination, staging_dir)
+    return recovered
+
+INSTALL_STAGES = ("download", "verify", "extract", "register")
+
+class PluginInstall:
+    """Runs one plugin through the install pipeline: download, verify, extract, register.
+
+    Archive entries are already extracted during the download where the zip allows it (see
+    StreamingExtractor), the extract stage handles whatever is left. Both only write to the
+    journal's staging folder, register renames the staged files into place (see InstallJournal).
+    Cancelling or failing at any stage before that, or during it, leaves the OBS folder as it was.
+    on_stage is called with each stage name as it starts, progress with (current, total,
+    bytes_per_second, eta_seconds) through a ProgressThrottle. When incremental, files that are
+    already up to date are left alone, the journal counts them.
+    """
+    def __init__(self, plugin, destination, cache=None, cancel=None, on_stage=None, progress=None, incremental=True):
+        self.plugin = plugin
+        self.incremental = incremental
+        self.journal = None
+        self.destination = destination
+        self.cache = cache or get_cache()
+        self.cancel = cancel
+        self.on_stage = on_stage
+        self.progress = ProgressThrottle(progress) if progress else None
+        self.stage = None
+
+    def _enter(self, stage):
+        check_cancelled(self.cancel)
+        self.stage = stage
+        if self.on_stage:
+            self.on_stage(stage)
+
+    def run(self):
+        """Install the plugin and return the path of its archive"""
+        journal = self.journal = InstallJournal(self.destination, self.plugin["name"])
+        extractor = StreamingExtractor(self.destination, journal, self.incremental)
+        zip_path = None
+        try:
+            self._enter("download")
+            zip_path = self.cache.fetch(self.plugin["download_url"], self.plugin["name"], self.progress,
+                                        sha256=self.plugin.get("sha256"), size=self.plugin.get("size"),
+                                        sink=extractor, cancel=self.cancel)
+            if self.progress:
+                self.progress.flush()
+            extractor.close()
+
+            self._enter("verify")
+            verify_archive(zip_path)
+
+            self._enter("extract")
+            extract_archive(zip_path, self.destination, skip=extractor.extracted, journal=journal, cancel=self.cancel,
+                            incremental=self.incremental)
+
+            self._enter("register")
+            journal.commit()
+        except BaseException:
+            extractor.close()
+            journal.rollback()
+            raise
+        finally:
+            # Archives normally move into the download cache, only clean up if that wasn't possible
+            if zip_path and os.path.dirname(zip_path) == self.cache.partial_dir:
+                os.remove(zip_path)
+        return zip_path
+
+class PluginDetector:
+    """Tells which manifest plugins are installed from one listing of the plugins folder.
+
+    The folder is read with a single os.scandir into a set of names, which is reused until the
+    folder's modification time changes. A status check for the whole manifest then costs one stat
+    instead of one per plugin, which matters on network-mounted OBS installs.
+    """
+    def __init__(self, plugins_folder):
+        self.plugins_folder = plugins_folder
+        self._entries = frozenset()
+        self._mtime = None
+
+    def entries(self):
+        """Return the normalised names in the plugins folder"""
+        try:
+            mtime = os.stat(self.plugins_folder).st_mtime_ns
+        except OSError:
+            self._mtime = None
+            return frozenset()
+        if mtime != self._mtime:
+            with os.scandir(self.plugins_folder) as scan:
+                self._entries = frozenset(os.path.normcase(entry.name) for entry in scan)
+            # A change in the same timestamp tick as this listing wouldn't move the mtime,
+            # so a listing that recent is not trusted next time
+            racy = time.time_ns() - mtime < 2_000_000_000
+            self._mtime = None if racy else mtime
+        return self._entries
+
+    @staticmethod
+    def _installed(plugin, entries):
+        # Every file named by the plugin's detect rule has to be there
+        return all(os.path.normcase(name) in entries for name in plugin.get("detect") or [plugin["file_name"]])
+
+    def is_installed(self, plugin):
+        return self._installed(plugin, self.entries())
+
+    def status(self, plugins):
+        """Return {plugin name: installed} for every plugin in the manifest"""
+        entries = self.entries()
+        return {plugin["name"]: self._installed(plugin, entries) for plugin in plugins}
+
+# Version of the manifest format this installer understands
+MANIFEST_VERSION = 1
+# A plugins.json next to the installer (or at MICKFX_MANIFEST) replaces the bundled manifest
+MANIFEST_NAME = "plugins.json"
+
+# Plugin fields: name -> (accepted types, required)
+MANIFEST_SCHEMA = {
+    "name": (str, True),
+    "description": (str, True),
+    "page_url": (str, True),
+    "download_url": (str, True),
+    "file_name": (str, True),
+    "required": (bool, True),
+    "sha256": (str, False),
+    "size": (int, False),
+    "detect": (list, False),
+}
+
+class ManifestError(Exception):
+    """The plugin manifest is missing, malformed or for a newer installer"""
+
+def validate_manifest(data):
+    """Check a parsed manifest against MANIFEST_SCHEMA and return its plugin list.
+
+    Optional fields are filled in: detect defaults to [file_name], the files that must all be
+    present in the plugins folder for the plugin to count as installed.
+    """
+    if not isinstance(data, dict):
+        raise ManifestError("manifest must be a JSON object")
+    version = data.get("manifest_version")
+    if not isinstance(version, int) or isinstance(version, bool):
+        raise ManifestError("manifest_version must be an integer")
+    if version > MANIFEST_VERSION:
+        raise ManifestError(f"manifest_version {version} needs a newer installer (this one reads {MANIFEST_VERSION})")
+    if not isinstance(data.get("plugins"), list):
+        raise ManifestError("plugins must be a list")
+
+    plugins = []
+    names = set()
+    for index, entry in enumerate(data["plugins"]):
+        where = f"plugins[{index}]"
+        if not isinstance(entry, dict):
+            raise ManifestError(f"{where} must be an object")
+        for field, (kind, required) in MANIFEST_SCHEMA.items():
+            if field not in entry:
+                if required:
+                    raise ManifestError(f"{where} is missing {field}")
+                continue
+            value = entry[field]
+            # bool is an int subclass, don't let true pass as a size
+            if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+                raise ManifestError(f"{where}.{field} must be {kind.__name__}")
+        unknown = set(entry) - set(MANIFEST_SCHEMA)
+        if unknown:
+            raise ManifestError(f"{where} has unknown fields: {', '.join(sorted(unknown))}")
+
+        plugin = dict(entry)
+        if plugin["name"] in names:
+            raise ManifestError(f"{where} repeats the name {plugin['name']!r}")
+        names.add(plugin["name"])
+        if "sha256" in plugin:
+            plugin["sha256"] = plugin["sha256"].lower()
+            if len(plugin["sha256"]) != 64 or any(c not in "0123456789abcdef" for c in plugin["sha256"]):
+                raise ManifestError(f"{where}.sha256 must be 64 hex digits")
+        if "size" in plugin and plugin["size"] < 0:
+            raise ManifestError(f"{where}.size must not be negative")
+        detect = plugin.get("detect") or [plugin["file_name"]]
+        # Detection works from one listing of the plugins folder, so only names directly inside it
+        if not all(isinstance(name, str) and name and not set(name) & set("/\\") for name in detect):
+            raise ManifestError(f"{where}.detect must list file names in the plugins folder")
+        plugin["detect"] = detect
+        plugins.append(plugin)
+    return plugins
+
+def load_manifest(path, cache_dir=MANIFEST_CACHE_DIR):
+    """Read and validate the manifest at path.
+
+    The validated plugin list is kept as a marshal file in cache_dir named after the manifest's
+    sha256, so an unchanged manifest is only hashed and loaded on later starts, not parsed again.
+    A cached list is still checked against MANIFEST_SCHEMA, anything else is ignored.
+    """
+    import hashlib
+    import json
+    import marshal
+
+    with open(path, "rb") as file:
+        raw = file.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    cached_path = os.path.join(cache_dir, f"{digest}-v{MANIFEST_VERSION}.marshal")
+    try:
+        with open(cached_path, "rb") as file:
+            return validate_manifest({"manifest_version": MANIFEST_VERSION, "plugins": marshal.load(file)})
+    except (OSError, EOFError, ValueError, TypeError, ManifestError):
+        pass
+
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except ValueError as e:
+        raise ManifestError(f"{path} is not valid JSON: {e}")
+    plugins = validate_manifest(data)
+
+    try:
+        os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+        temp_path = f"{cached_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            marshal.dump(plugins, file)
+        os.replace(temp_path, cached_path)
+    except OSError as e:
+        print(f"Could not cache the parsed manifest: {e}")
+    return plugins
+
+def manifest_candidates(bundled_path):
+    """Manifest locations in order of preference: MICKFX_MANIFEST, next to the installer, bundled"""
+    import sys
+
+    if getattr(sys, "frozen", False):
+        app_dir = os.path.dirname(sys.executable)
+    else:
+        app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    candidates = [os.environ.get("MICKFX_MANIFEST"), os.path.join(app_dir, MANIFEST_NAME), bundled_path]
+    return [path for path in candidates if path]
+
+def load_plugin_manifest(bundled_path):
+    """Load the first usable manifest, falling back to the bundled one if an override is broken"""
+    *overrides, bundled = manifest_candidates(bundled_path)
+    for path in overrides:
+        if not os.path.isfile(path) or os.path.abspath(path) == os.path.abspath(bundled):
+            continue
+        try:
+            plugins = load_manifest(path)
+            print(f"Using plugin manifest {path}")
+            return plugins
+        except (OSError, ManifestError) as e:
+            print(f"Ignoring plugin manifest {path}: {e}")
+    return load_manifest(bundled)
+
+def obs_root_folder(obs_path):
+    """The OBS Studio folder, given obs64.exe (bin/64bit/obs64.exe) or the folder itself.
+
+    Plugin archives mirror this folder's layout, so this is where they are extracted.
+    """
+    if os.path.isfile(obs_path) or obs_path.lower().endswith(".exe"):
+        return os.path.dirname(os.path.dirname(os.path.dirname(obs_path)))
+    return obs_path
+
+def obs_plugins_folder(obs_path):
+    """The obs-plugins/64bit folder, where installed plugins are detected"""
+    return os.path.join(obs_root_folder(obs_path), "obs-plugins", "64bit")
+
+def copy_sef(source_sef, destination_folder=None):
+    """Copy the SAMMI extension into the user's Downloads folder and return its new path"""
+    import shutil
+
+    destination_folder = destination_folder or os.path.join(os.path.expanduser("~"), "Downloads")
+    os.makedirs(destination_folder, exist_ok=True)
+    destination = os.path.join(destination_folder, os.path.basename(source_sef))
+    shutil.copy2(source_sef, destination)
+    return destination
+
+def attach_parent_console():
+    """Print to the console a windowed (--noconsole) build was started from.
+
+    Windowed exes start without stdout/stderr. Does nothing for the console build or when
+    run as a script, and sends output nowhere when there is no console to attach to.
+    """
+    import sys
+    if sys.stdout is not None and sys.stderr is not None:
+        return
+    import ctypes
+    # ATTACH_PARENT_PROCESS
+    if os.name == "nt" and ctypes.windll.kernel32.AttachConsole(-1):
+        sys.stdout = open("CONOUT$", "w", buffering=1)
+        sys.stderr = open("CONOUT$", "w", buffering=1)
+    else:
+        sys.stdout = sys.stderr = open(os.devnull, "w")
+
+def run_headless(argv, resource_dir):
+    """Install plugins from the command line without the installer window or any Qt import.
+
+    Returns the process exit code: 0 when everything asked for is installed, 1 if an install
+    failed, 2 for bad arguments and 130 when interrupted (unfinished installs are rolled back).
+    """
+    import argparse
+    import sys
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    parser = argparse.ArgumentParser(prog="mickfx-plugin-installer --headless",
+                                     description="Install the MickFX OBS plugins without the installer window.")
+    parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--obs-path", required=True, help="obs64.exe, or the OBS Studio folder")
+    parser.add_argument("--plugins", default="all",
+                        help="'all', 'required' or a comma-separated list of plugin names (default: all)")
+    parser.add_argument("--jobs", type=int, default=MAX_PARALLEL_DOWNLOADS,
+                        help=f"plugins installed at the same time (default: {MAX_PARALLEL_DOWNLOADS})")
+    parser.add_argument("--no-sef", action="store_true", help="don't copy MickFX Base.sef to Downloads")
+    parser.add_argument("--repair", action="store_true",
+                        help="reinstall the selected plugins even if they are installed, rewriting only changed files")
+    parser.add_argument("--full", action="store_true", help="rewrite every file instead of skipping unchanged ones")
+    args = parser.parse_args(argv)
+
+    plugins_folder = obs_plugins_folder(args.obs_path)
+    if not os.path.isdir(plugins_folder):
+        print(f"OBS plugins folder not found: {plugins_folder}", file=sys.stderr)
+        return 2
+    try:
+        manifest = load_plugin_manifest(os.path.join(resource_dir, MANIFEST_NAME))
+    except (OSError, ManifestError) as e:
+        print(f"Could not load the plugin manifest: {e}", file=sys.stderr)
+        return 2
+
+    if args.plugins == "all":
+        selected = manifest
+    elif args.plugins == "required":
+        selected = [plugin for plugin in manifest if plugin["required"]]
+    else:
+        by_name = {plugin["name"].lower(): plugin for plugin in manifest}
+        # Each plugin once, two installs of one plugin would share its staging folder and partial download
+        names = list(dict.fromkeys(name.strip().lower() for name in args.plugins.split(",") if name.strip()))
+        unknown = [name for name in names if name not in by_name]
+        if unknown:
+            print(f"Unknown plugins: {', '.join(unknown)}. Known: {', '.join(p['name'] for p in manifest)}", file=sys.stderr)
+            return 2
+        selected = [by_name[name] for name in names]
+
+    for name in recover_installs(obs_root_folder(args.obs_path)):
+        print(f"Rolled back the interrupted install of {name}")
+    status = PluginDetector(plugins_folder).status(manifest)
+    missing = [plugin for plugin in selected if args.repair or not status[plugin["name"]]]
+    for plugin in selected:
+        if plugin not in missing:
+            print(f"{plugin['name']}: already installed")
+
+    cancel = threading.Event()
+    failed = []
+
+    def install(plugin):
+        # One write per line so lines from parallel installs don't interleave
+        stage = lambda name: print(f"{plugin['name']}: {name}\n", end="", flush=True)
+        install = PluginInstall(plugin, obs_root_folder(args.obs_path), cancel=cancel, on_stage=stage,
+                                incremental=not args.full)
+        install.run()
+        return install.journal
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = {executor.submit(install, plugin): plugin for plugin in missing}
+        try:
+            for future in as_completed(futures):
+                plugin = futures[future]
+                try:
+                    journal = future.result()
+                    unchanged = ""
+                    if journal.skipped_files:
+                        unchanged = (f", {journal.skipped_files} of {journal.skipped_files + len(journal.files)} files"
+                                     f" unchanged ({journal.skipped_bytes / 1024:.0f} KB skipped)")
+                    print(f"{plugin['name']}: installed{unchanged}\n", end="", flush=True)
+                except Exception as e:
+                    failed.append(plugin)
+                    print(f"{plugin['name']}: failed: {e}\n", end="", file=sys.stderr, flush=True)
+        except KeyboardInterrupt:
+            # Leaving the with block waits for the running installs to roll back
+            print("Interrupted, rolling back unfinished installs", file=sys.stderr)
+            cancel.set()
+            return 130
+
+    status = PluginDetector(plugins_folder).status(manifest)
+    if not args.no_sef and all(status[plugin["name"]] for plugin in manifest if plugin["required"]):
+        try:
+            print(f"Copied MickFX Base.sef to {copy_sef(os.path.join(resource_dir, 'MickFX Base.sef'))}")
+        except OSError as e:
+            print(f"Could not copy MickFX Base.sef: {e}", file=sys.stderr)
+            return 1
+    return 1 if failed else 0
+
+class StartupTrace:
+    """Timeline of startup phases, asset loads and first paints in Chrome trace format.
+
+    Disabled until enable() is called, recording is then a no-op. Open the written JSON in
+    chrome://tracing or ui.perfetto.dev. Times come from time.perf_counter, relative to origin.
+    """
+    def __init__(self):
+        self.path = None
+        self.origin = time.perf_counter()
+        self.events = []
+        self._firsts = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def enable(self, path, origin=None):
+        self.path = path
+        if origin is not None:
+            self.origin = origin
+
+    def _add(self, event):
+        event.update(pid=os.getpid(), tid=threading.get_ident())
+        with self._lock:
+            self.events.append(event)
+
+    def record(self, name, start, end, category="phase", **args):
+        """Add a span between two time.perf_counter readings"""
+        if self.enabled:
+            self._add({"name": name, "cat": category, "ph": "X", "ts": (start - self.origin) * 1e6,
+                       "dur": (end - start) * 1e6, "args": args})
+
+    @contextlib.contextmanager
+    def span(self, name, category="phase", **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter(), category, **args)
+
+    def phase(self, func):
+        """Decorator recording every call of func as a span named after it"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            with self.span(func.__qualname__):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def mark(self, name, category="mark", **args):
+        if self.enabled:
+            self._add({"name": name, "cat": category, "ph": "i", "s": "g",
+                       "ts": (time.perf_counter() - self.origin) * 1e6, "args": args})
+
+    def first(self, name, category="paint"):
+        """Mark name the first time it happens, e.g. the first paint of a widget"""
+        if self.enabled and name not in self._firsts:
+            self._firsts.add(name)
+            self.mark(name, category)
+
+    def write(self):
+        if not self.enabled:
+            return
+        import json
+
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event["ts"])
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        print(f"Startup trace written to {self.path}")
+
+# Process-wide startup trace, enabled by --trace or MICKFX_TRACE (see the installer's __main__)
+startup_trace = StartupTrace()
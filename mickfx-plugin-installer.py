@@ -1,26 +1,60 @@
 import sys
 import os
+import array
 import random
-import shutil
+import threading
+import time
+import warnings
+try:
+    # Removed in Python 3.13 (deprecated before that), mixing then falls back to array arithmetic
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ImportError:
+    audioop = None
+
+# Taken before the Qt imports so the startup trace includes them
+STARTED = time.perf_counter()
 
-from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QMessageBox, QGraphicsDropShadowEffect, QGraphicsOpacityEffect, QFrame)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QObject, QRunnable, QThreadPool, QUrl, QPropertyAnimation, QRectF, QPointF, QEasingCurve
-from PyQt5.QtGui import QPixmap, QPainter, QMovie, QFontDatabase, QIcon, QColor, QFont, QPainterPath, QPen, QDesktopServices
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+def resource_path(relative_path):
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
 
-class LogoBackgroundWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._background_image = None
-        self.setAttribute(Qt.WA_StyledBackground, True)
+    return os.path.join(base_path, relative_path)
 
-    @property
-    def background_image(self):
-        if self._background_image is None:
-            self._background_image = QPixmap(resource_path(os.path.join("MickFX Required Sources", "MickFX Background.jpg")))
-        return self._background_image
+# Unattended installs (--headless) never load Qt, see installer_core.run_headless
+if __name__ == '__main__' and "--headless" in sys.argv:
+    from installer_core import attach_parent_console, run_headless
+    attach_parent_console()
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    sys.exit(run_headless(sys.argv[1:], os.path.join(base_path, "MickFX Required Sources")))
+
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QMessageBox, QGraphicsDropShadowEffect, QGraphicsOpacityEffect, QFrame)
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QEvent, QIODevice, QTimer, QFileSystemWatcher, pyqtSignal, pyqtSlot, QObject, QRunnable, QThreadPool, QUrl, QPropertyAnimation, QRectF, QPointF, QEasingCurve
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache, QPainter, QImageReader, QFontDatabase, QIcon, QColor, QFont, QPainterPath, QPen, QDesktopServices
+# QtMultimedia (and requests/zipfile in installer_core) are imported where first used, so they
+# don't add to cold start before the window is up
+
+from installer_core import (MANIFEST_NAME, MAX_PARALLEL_DOWNLOADS, InstallCancelled, PluginDetector, PluginInstall, copy_sef,
+                            load_plugin_manifest, obs_plugins_folder, obs_root_folder, recover_installs, startup_trace)
+
+# Changes to the plugins folder are batched for this long before the status is refreshed
+PLUGIN_WATCH_DEBOUNCE = 250
+# Polling interval when the plugins folder can't be watched (e.g. some network drives)
+PLUGIN_POLL_INTERVAL = 5000
+# Header logo assets in order of preference, the first one that actually animates is played
+LOGO_ANIMATIONS = ("MickFX Logo.webp", "MickFX Logo.gif")
+# Frame budget for the header logo, frames due sooner than this are skipped
+LOGO_MAX_FPS = max(1.0, float(os.environ.get("MICKFX_LOGO_FPS", "24")))
 
 class OBSPluginInstaller(QWidget):
+    # Emitted once complete_initialization has built the whole window
+    initialized = pyqtSignal()
+
+    @startup_trace.phase
     def __init__(self):
         super().__init__()
         
@@ -35,12 +69,25 @@ class OBSPluginInstaller(QWidget):
         self.plugin_alert_shown = False
         self.installation_in_progress = False
         self.current_popup = None
-        self._success_player = None
-        self._error_player = None
-        self._end_player = None
-        self._loading_player = None
+        self._sound_effects = None
         self._media_player = None
 
+        # Downloads run on their own pool so the concurrency cap doesn't affect other work
+        self.download_pool = QThreadPool(self)
+        self.download_pool.setMaxThreadCount(MAX_PARALLEL_DOWNLOADS)
+        self.install_batch = []
+        self.install_progress = {}
+        self.install_rates = {}
+        self.pending_installs = set()
+        self.install_failures = []
+        self.install_cancelled = []
+        self.install_signals = {}
+        self.install_cancel = threading.Event()
+        self.plugin_detector = None
+        self._plugins = None
+        # Plugin name -> its manifest entry and row widgets, filled in by add_plugin_row
+        self.plugin_rows = {}
+
         # Create basic layout
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setSpacing(0)
@@ -57,18 +104,15 @@ class OBSPluginInstaller(QWidget):
         # Stage the initialization
         QTimer.singleShot(0, self.init_stage1)
 
+    @startup_trace.phase
     def init_stage1(self):
         # Load font
-        self.resource_folder = self.find_resource_folder()
-        font_path = resource_path(os.path.join("MickFX Required Sources", "Tomorrow-Medium.ttf"))
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        
-        # Start background music
-        QTimer.singleShot(0, self.init_background_music)
+        resources.font_family("Tomorrow-Medium.ttf")
         
         # Continue with UI setup
         QTimer.singleShot(0, self.init_stage2)
 
+    @startup_trace.phase
     def init_stage2(self):
         # Initialize content layout
         self.content_layout = QVBoxLayout(self.content_background)
@@ -80,71 +124,41 @@ class OBSPluginInstaller(QWidget):
 
     def lazy_load_media_player(self):
         if self._media_player is None:
+            from PyQt5.QtMultimedia import QMediaPlayer
             self._media_player = QMediaPlayer()
-            self._media_player.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "MickFX Song.mp3")))))
+            self._media_player.setMedia(resources.media("MickFX Song.mp3"))
             self._media_player.setVolume(75)
         return self._media_player
 
-    def get_success_player(self):
-        if self._success_player is None:
-            self._success_player = QMediaPlayer()
-            self._success_player.setVolume(50)
-        return self._success_player
+    def get_sound_effects(self):
+        if self._sound_effects is None:
+            self._sound_effects = SoundEffects(SOUND_EFFECTS, volume=0.5, parent=self)
+        return self._sound_effects
 
     def play_success_sound(self):
-        if not hasattr(self, '_success_sounds'):
-            self._success_sounds = []
-            for i in range(1, 4):
-                sound = QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", f"Yoshi{i}.mp3"))))
-                self._success_sounds.append(sound)
-        
-        player = self.get_success_player()
-        player.setMedia(random.choice(self._success_sounds))
-        player.play()
+        self.get_sound_effects().play(f"Yoshi{random.randint(1, 3)}.mp3")
 
     def play_error_sound(self):
-        if self._error_player is None:
-            self._error_player = QMediaPlayer()
-            self._error_player.setVolume(50)
-            self._error_player.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "Yoshi Error.mp3")))))
-        self._error_player.play()
+        self.get_sound_effects().play("Yoshi Error.mp3")
 
     def play_end_sound(self):
-        if self._end_player is None:
-            self._end_player = QMediaPlayer()
-            self._end_player.setVolume(50)
-            self._end_player.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "Yoshi End.mp3")))))
-        self._end_player.play()
+        self.get_sound_effects().play("Yoshi End.mp3")
 
     def play_loading_sound(self):
-        if self._loading_player is None:
-            self._loading_player = QMediaPlayer()
-            self._loading_player.setVolume(50)
-            self._loading_player.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "Yoshi Loading.mp3")))))
-        self._loading_player.play()
+        self.get_sound_effects().play("Yoshi Loading.mp3")
 
+    @startup_trace.phase
     def init_background_music(self):
-        self._media_player = QMediaPlayer()
-        self._media_player.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "MickFX Song.mp3")))))
-        self._media_player.setVolume(75)
-        self._media_player.play()
+        self.lazy_load_media_player().play()
+        # Start decoding the sound effects so the first one plays without delay
+        self.get_sound_effects()
 
+    @startup_trace.phase
     def complete_initialization(self):
         from PyQt5.QtCore import QSize
-        # Start loading the background music after UI is shown
-        QTimer.singleShot(100, lambda: self.lazy_load_media_player().play())
-        # Load custom font
-        self.resource_folder = self.find_resource_folder()
-        font_path = resource_path(os.path.join("MickFX Required Sources", "Tomorrow-Medium.ttf"))
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id != -1:
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-        else:
-            print("Error loading custom font")
-            font_family = "Arial"  # Fallback font
-            
-        # Sound effect setup
-        self.setup_sound_effects()
+        # Custom font, already loaded by init_stage1
+        font_family = resources.font_family("Tomorrow-Medium.ttf")
+
         # Define colors
         purple_color = QColor(102, 45, 145)        # Main purple color
         gold_color = QColor(255, 215, 0)           # Gold color
@@ -244,36 +258,20 @@ class OBSPluginInstaller(QWidget):
         }}
         """)
 
-        # Clear any existing widgets from main layout
-        while self.main_layout.count():
-            item = self.main_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Create background container for logo
-        logo_background = LogoBackgroundWidget(self)
-        logo_background.setFixedHeight(190)  # Adjust this value as needed
-        self.main_layout.addWidget(logo_background)
+        # The background containers from __init__ are kept, only their contents are added here
+        logo_background = self.logo_background
 
         # Logo layout inside logo background
         logo_layout = QVBoxLayout(logo_background)
         logo_layout.setContentsMargins(0, 5, 20, 40)  # Adjust margins as needed
         
         self.logo_label = ScalingClickableLabel()
-        self.logo_movie = QMovie(resource_path(os.path.join("MickFX Required Sources", "MickFX Logo.gif")))
-        self.logo_label.setMovie(self.logo_movie)
-        self.logo_movie.setSpeed(140)  # Base speed
-        self.logo_movie.start()
         logo_layout.addWidget(self.logo_label, alignment=Qt.AlignCenter)
+        self.logo_label.setAnimation(resources.data(logo_animation_name()), speed=140)  # Base speed
+        self.update_logo_playback()
 
-        # Content container with the second background
-        content_background = ContentBackgroundWidget(self)
-        self.main_layout.addWidget(content_background)
-
-        # Separate layouts for Paragraph/Signature and Icons
-        content_layout = QVBoxLayout(content_background)
-        content_layout.setSpacing(0)
-        content_layout.setContentsMargins(0, 0, 0, 0)
+        # Separate layouts for Paragraph/Signature and Icons, inside the content background
+        content_layout = self.content_layout
 
         # Paragraph/Signature layout
         self.paragraph_signature_layout = QVBoxLayout()
@@ -314,7 +312,7 @@ class OBSPluginInstaller(QWidget):
 
         # Mute button (now on the left)
         self.mute_button = QPushButton()
-        self.mute_button.setIcon(QIcon(os.path.join(self.resource_folder, "Volume Icon.png")))
+        self.mute_button.setIcon(resources.icon("Volume Icon.png"))
         self.mute_button.setIconSize(QSize(24, 24))
         self.mute_button.setFixedSize(32, 32)
         self.mute_button.setStyleSheet("""
@@ -342,7 +340,7 @@ class OBSPluginInstaller(QWidget):
 
         for icon_file, url in social_icons:
             icon_button = QPushButton()
-            icon_button.setIcon(QIcon(os.path.join(self.resource_folder, icon_file)))
+            icon_button.setIcon(resources.icon(icon_file))
             icon_button.setIconSize(QSize(30, 30))
             icon_button.setFixedSize(34, 34)
             icon_button.setStyleSheet("""
@@ -451,12 +449,26 @@ class OBSPluginInstaller(QWidget):
 
         self.plugin_layout = QVBoxLayout()
         lower_card_layout.addLayout(self.plugin_layout)
+
+        self.install_all_button = QPushButton("Install All Missing")
+        self.install_all_button.clicked.connect(self.install_all_missing)
+        self.install_all_button.setVisible(False)
+        lower_card_layout.addWidget(self.install_all_button)
         
         from PyQt5.QtWidgets import QProgressBar
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        lower_card_layout.addWidget(self.progress_bar)
+
+        # Cancel sits next to the progress bar while an install is running
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_installs)
+        self.cancel_button.setVisible(False)
+
+        progress_layout = QHBoxLayout()
+        progress_layout.addWidget(self.progress_bar, 1)
+        progress_layout.addWidget(self.cancel_button)
+        lower_card_layout.addLayout(progress_layout)
 
         # Add the lower card widget to the obs_layout
         self.obs_layout.addWidget(lower_card_widget)
@@ -473,79 +485,23 @@ class OBSPluginInstaller(QWidget):
 
         self.setLayout(self.main_layout)
 
-        self.plugins = [
-            {
-                "name": "Source Clone",
-                "description": "Allows you to clone sources.",
-                "page_url": "https://obsproject.com/forum/resources/source-clone.1632/",
-                "download_url": "https://obsproject.com/forum/resources/source-clone.1632/version/5627/download?file=104021",
-                "file_name": "source-clone.pdb",
-                "required": True
-            },
-            {
-                "name": "Obs-shaderfilter",
-                "description": "Allows you to add shaders effects to sources.",
-                "page_url": "https://obsproject.com/forum/resources/obs-shaderfilter.1736/",
-                "download_url": "https://github.com/exeldro/obs-shaderfilter/releases/download/2.3.2/obs-shaderfilter-2.3.2-windows.zip",
-                "file_name": "obs-shaderfilter.pdb",
-                "required": True
-            },
-            {
-                "name": "Advanced Masks",
-                "description": "Set up masks which you can change.",
-                "page_url": "https://obsproject.com/forum/resources/advanced-masks.1856/",
-                "download_url": "https://obsproject.com/forum/resources/advanced-masks.1856/version/5424/download?file=101265",
-                "file_name": "obs-advanced-masks.pdb",
-                "required": True
-            },
-            {
-                "name": "Move Source",
-                "description": "Move sources and change values.",
-                "page_url": "https://obsproject.com/forum/resources/move.913/",
-                "download_url": "https://obsproject.com/forum/resources/move.913/version/5662/download?file=104546",
-                "file_name": "move-transition.pdb",
-                "required": True
-            },
-            {
-                "name": "Vintage Filter",
-                "description": "Adds black & white or sepia effects to sources.",
-                "page_url": "https://obsproject.com/forum/resources/vintage-filter.818/",
-                "download_url": "https://github.com/cg2121/obs-vintage-filter/releases/download/1.0.0/obs-vintage-filter-1.0.0-windows-x64.zip",
-                "file_name": "obs-vintage-filter.dll",
-                "required": False
-            }
-        ]
-        self.resource_folder = self.find_resource_folder()
+        # Plugin status follows change notifications for the plugins folder, the timer
+        # only polls when the folder can't be watched
+        self.plugins_watcher = QFileSystemWatcher(self)
+        self.plugins_watcher.directoryChanged.connect(self.on_plugins_folder_changed)
+        self.watch_debounce = QTimer(self)
+        self.watch_debounce.setSingleShot(True)
+        self.watch_debounce.setInterval(PLUGIN_WATCH_DEBOUNCE)
+        self.watch_debounce.timeout.connect(self.refresh_watched_plugins)
         self.timer = QTimer()
-        self.timer.timeout.connect(self.check_plugins)
+        self.timer.timeout.connect(self.refresh_watched_plugins)
         QTimer.singleShot(100, self.adjustSize)
         self.layout_updated = False
+        self.initialized.emit()
+        # Start background music once the window is up, this is what first loads QtMultimedia
+        QTimer.singleShot(0, self.init_background_music)
         
 
-    def setup_sound_effects(self):
-        # Create separate players for different types of sounds
-        self.success_player = QMediaPlayer()
-        self.error_player = QMediaPlayer()
-        self.end_player = QMediaPlayer()
-        self.loading_player = QMediaPlayer()
-        
-        # Load success sounds (Yoshi1, Yoshi2, Yoshi3)
-        self.success_sounds = []
-        for i in range(1, 4):  # Will load Yoshi1.mp3, Yoshi2.mp3, Yoshi3.mp3
-            sound = QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", f"Yoshi{i}.mp3"))))
-            self.success_sounds.append(sound)
-        
-        # Load error and end sounds
-        self.error_sound = QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "Yoshi Error.mp3"))))
-        self.end_sound = QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "Yoshi End.mp3"))))
-        self.loading_sound = QMediaContent(QUrl.fromLocalFile(resource_path(os.path.join("MickFX Required Sources", "Yoshi Loading.mp3"))))
-        
-        # Set default volumes
-        self.success_player.setVolume(50)
-        self.error_player.setVolume(50)
-        self.end_player.setVolume(50)
-        self.loading_player.setVolume(50)
-            
     def adjustSize(self):
         # Force layout update
         self.layout().activate()
@@ -559,24 +515,34 @@ class OBSPluginInstaller(QWidget):
         super().showEvent(event)
         # Trigger adjust size after show event
         QTimer.singleShot(100, self.adjustSize)
+        self.update_logo_playback()
 
-    def find_resource_folder(self):
-        current_folder = os.path.dirname(os.path.abspath(__file__))
-        resource_folder = os.path.join(current_folder, "MickFX Required Sources")
-        if os.path.exists(resource_folder):
-            return resource_folder
-        resource_folder = os.path.join(current_folder, "..", "MickFX Required Sources")
-        if os.path.exists(resource_folder):
-            return resource_folder
-        return ""
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_logo_playback()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.update_logo_playback()
+
+    def update_logo_playback(self):
+        """Run the header animation only while it can be seen"""
+        if not hasattr(self, 'logo_label'):
+            return
+        covered = any(overlay.covering for overlay in self.findChildren(DarkOverlay))
+        if self.isVisible() and not self.isMinimized() and not covered:
+            self.logo_label.start()
+        else:
+            self.logo_label.stop()
 
     def toggle_mute(self):
         if self._media_player.isMuted():
             self._media_player.setMuted(False)
-            self.mute_button.setIcon(QIcon(os.path.join(self.resource_folder, "Volume Icon.png")))
+            self.mute_button.setIcon(resources.icon("Volume Icon.png"))
         else:
             self._media_player.setMuted(True)
-            self.mute_button.setIcon(QIcon(os.path.join(self.resource_folder, "Mute Icon.png")))
+            self.mute_button.setIcon(resources.icon("Mute Icon.png"))
 
     def hide_paragraph_signature(self):
         if hasattr(self, 'message_signature_card'):
@@ -613,7 +579,7 @@ class OBSPluginInstaller(QWidget):
                 QApplication.processEvents()
                 
                 # Update the layout manually
-                self.update_plugin_layout(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(self.obs_exe_path))), "obs-plugins", "64bit"))
+                self.update_plugin_layout(self.get_plugins_folder())
                 
             else:
                 QMessageBox.warning(self, "Error", "Please select the correct obs64.exe file.")
@@ -624,16 +590,21 @@ class OBSPluginInstaller(QWidget):
             print("OBS executable path is not set")
             return False
 
-        plugins_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(self.obs_exe_path))), "obs-plugins", "64bit")
+        plugins_folder = self.get_plugins_folder()
         print(f"Plugins folder: {plugins_folder}")
 
         if not os.path.exists(plugins_folder):
             print(f"Plugins folder not found: {plugins_folder}")
             return False
 
+        # Undo the commit of an install that was cut short, e.g. by a crash or power loss
+        if not self.installation_in_progress:
+            for name in recover_installs(obs_root_folder(self.obs_exe_path)):
+                print(f"Rolled back the interrupted install of {name}")
+
         print(f"Current plugin layout count: {self.plugin_layout.count()}")
 
-        if self.plugin_layout.count() == 0:
+        if not self.plugin_rows:
             print("Creating initial plugin layout")
             self.initial_plugin_layout(plugins_folder)
         else:
@@ -643,67 +614,124 @@ class OBSPluginInstaller(QWidget):
         print("Finished check_plugins method")
         return True
 
+    def get_plugins_folder(self):
+        return obs_plugins_folder(self.obs_exe_path)
+
+    def start_plugin_watch(self):
+        plugins_folder = self.get_plugins_folder()
+        if plugins_folder in self.plugins_watcher.directories() or self.timer.isActive():
+            return
+        if not self.plugins_watcher.addPath(plugins_folder):
+            print(f"Can't watch {plugins_folder}, polling it instead")
+            self.timer.start(PLUGIN_POLL_INTERVAL)
+
+    def stop_plugin_watch(self):
+        if self.plugins_watcher.directories():
+            self.plugins_watcher.removePaths(self.plugins_watcher.directories())
+        self.watch_debounce.stop()
+        self.timer.stop()
+
+    def on_plugins_folder_changed(self, path):
+        # Installs and uninstalls touch several files at once, refresh once they settle
+        self.watch_debounce.start()
+
+    def refresh_watched_plugins(self):
+        """Debounced or polled refresh, re-arms the watch if the watcher dropped the folder"""
+        if self.obs_exe_path:
+            plugins_folder = self.get_plugins_folder()
+            # The watcher forgets a folder that is deleted or replaced, e.g. by an OBS reinstall
+            if plugins_folder not in self.plugins_watcher.directories():
+                if os.path.isdir(plugins_folder) and self.plugins_watcher.addPath(plugins_folder):
+                    self.timer.stop()
+                elif not self.timer.isActive():
+                    print(f"Can't watch {plugins_folder}, polling it instead")
+                    self.timer.start(PLUGIN_POLL_INTERVAL)
+        self.check_plugins()
+
+    @property
+    def plugins(self):
+        """Plugin manifest, read on first use (see installer_core.load_plugin_manifest)"""
+        if self._plugins is None:
+            with startup_trace.span(MANIFEST_NAME, "asset"):
+                self._plugins = load_plugin_manifest(resource_path(os.path.join("MickFX Required Sources", MANIFEST_NAME)))
+        return self._plugins
+
+    def plugin_status(self, plugins_folder):
+        """Installed/missing map for the whole manifest, from one cached listing of the folder"""
+        if self.plugin_detector is None or self.plugin_detector.plugins_folder != plugins_folder:
+            self.plugin_detector = PluginDetector(plugins_folder)
+        return self.plugin_detector.status(self.plugins)
+
+    def add_plugin_row(self, plugin, plugin_installed):
+        """Build the description, page link and status row for one plugin and register its widgets"""
+        plugin_layout = QVBoxLayout()
+        plugin_layout.setContentsMargins(5, 5, 5, 5)
+        plugin_layout.setSpacing(5)
+
+        plugin_label = QLabel(f"<b>{plugin['name']}</b> - {plugin['description']}")
+        plugin_label.setWordWrap(True)
+        plugin_layout.addWidget(plugin_label)
+
+        button_layout = QHBoxLayout()
+
+        page_button = QPushButton("Plugin Page")
+        page_button.setStyleSheet("color: blue;")
+        page_button.clicked.connect(lambda _, url=plugin['page_url']: QDesktopServices.openUrl(QUrl(url)))
+        button_layout.addWidget(page_button, 1)
+
+        status_frame = QFrame()
+        status_frame.setFrameShape(QFrame.Box)
+        status_frame.setFrameShadow(QFrame.Raised)
+        status_frame_layout = QHBoxLayout(status_frame)
+        status_frame_layout.setContentsMargins(0, 0, 0, 0)
+        status_frame_layout.setSpacing(0)
+
+        status_label = QLabel()
+        status_label.setAlignment(Qt.AlignCenter)
+        status_frame_layout.addWidget(status_label)
+
+        # Always created so the row can offer it again if the plugin is removed later
+        install_button = QPushButton("Auto-Install")
+        install_button.setStyleSheet("background-color: #e5f3ff; font-weight: bold;")
+        install_button.clicked.connect(lambda _, p=plugin: self.install_plugin(p))
+        status_frame_layout.addWidget(install_button)
+
+        status_frame_layout.setStretch(0, 2)
+        status_frame_layout.setStretch(1, 2)
+
+        button_layout.addWidget(status_frame, 2)
+
+        plugin_layout.addLayout(button_layout)
+
+        self.plugin_layout.addLayout(plugin_layout)
+        self.plugin_rows[plugin['name']] = {
+            "plugin": plugin,
+            "layout": plugin_layout,
+            "status_label": status_label,
+            "install_button": install_button,
+        }
+        if plugin_installed:
+            self.set_plugin_status(plugin, "Installed")
+        else:
+            self.set_plugin_status(plugin, "Not Installed", "red")
+        print(f"Added plugin layout for {plugin['name']} to the layout")  # Debugging statement
+
     def initial_plugin_layout(self, plugins_folder):
         if not os.path.exists(plugins_folder) or not self.obs_exe_path:
             return False
 
         all_required_installed = True
+        installed = self.plugin_status(plugins_folder)
 
         # First handle required plugins
         for plugin in [p for p in self.plugins if p["required"]]:
-            plugin_installed = os.path.exists(os.path.join(plugins_folder, plugin["file_name"]))
+            plugin_installed = installed[plugin["name"]]
             print(f"Plugin: {plugin['name']}, Installed: {plugin_installed}")
 
             if not plugin_installed:
                 all_required_installed = False
 
-            # Create a new plugin layout
-            plugin_layout = QVBoxLayout()
-            plugin_layout.setContentsMargins(5, 5, 5, 5)
-            plugin_layout.setSpacing(5)
-
-            plugin_label = QLabel(f"<b>{plugin['name']}</b> - {plugin['description']}")
-            plugin_label.setObjectName(f"label_{plugin['name']}")
-            plugin_label.setWordWrap(True)
-            plugin_layout.addWidget(plugin_label)
-
-            button_layout = QHBoxLayout()
-
-            page_button = QPushButton("Plugin Page")
-            page_button.setStyleSheet("color: blue;")
-            page_button.clicked.connect(lambda _, url=plugin['page_url']: QDesktopServices.openUrl(QUrl(url)))
-            button_layout.addWidget(page_button, 1)
-
-            status_frame = QFrame()
-            status_frame.setFrameShape(QFrame.Box)
-            status_frame.setFrameShadow(QFrame.Raised)
-            status_frame_layout = QHBoxLayout(status_frame)
-            status_frame_layout.setContentsMargins(0, 0, 0, 0)
-            status_frame_layout.setSpacing(0)
-
-            status_label = QLabel("Installed" if plugin_installed else "Not Installed")
-            status_label.setAlignment(Qt.AlignCenter)
-            status_label.setObjectName(f"status_label_{plugin['name']}")
-            status_label.setStyleSheet("font-weight: bold;" if plugin_installed else "font-weight: bold; color: red;")
-            status_frame_layout.addWidget(status_label)
-
-            if not plugin_installed:
-                install_button = QPushButton("Auto-Install")
-                install_button.setObjectName(f"install_button_{plugin['name']}")
-                install_button.setStyleSheet("background-color: #e5f3ff; font-weight: bold;")
-                install_button.clicked.connect(lambda _, p=plugin: self.install_plugin(p))
-                status_frame_layout.addWidget(install_button)
-
-            status_frame_layout.setStretch(0, 2)
-            status_frame_layout.setStretch(1, 2)
-
-            button_layout.addWidget(status_frame, 2)
-
-            plugin_layout.addLayout(button_layout)
-
-            # Add the plugin layout to the main plugin layout
-            self.plugin_layout.addLayout(plugin_layout)
-            print(f"Added plugin layout for {plugin['name']} to the layout")  # Debugging statement
+            self.add_plugin_row(plugin, plugin_installed)
 
         # Add separator and Optional Plugins section
         optional_plugins = [p for p in self.plugins if not p["required"]]
@@ -735,61 +763,18 @@ class OBSPluginInstaller(QWidget):
 
             # Now handle optional plugins
             for plugin in optional_plugins:
-                plugin_installed = os.path.exists(os.path.join(plugins_folder, plugin["file_name"]))
+                plugin_installed = installed[plugin["name"]]
                 print(f"Plugin: {plugin['name']}, Installed: {plugin_installed}")
 
-                # Create a new plugin layout
-                plugin_layout = QVBoxLayout()
-                plugin_layout.setContentsMargins(5, 5, 5, 5)
-                plugin_layout.setSpacing(5)
+                self.add_plugin_row(plugin, plugin_installed)
 
-                plugin_label = QLabel(f"<b>{plugin['name']}</b> - {plugin['description']}")
-                plugin_label.setObjectName(f"label_{plugin['name']}")
-                plugin_label.setWordWrap(True)
-                plugin_layout.addWidget(plugin_label)
+        self.update_install_all_button(plugins_folder)
 
-                button_layout = QHBoxLayout()
+        # Watching is free while idle, so keep following the folder either way
+        self.start_plugin_watch()
 
-                page_button = QPushButton("Plugin Page")
-                page_button.setStyleSheet("color: blue;")
-                page_button.clicked.connect(lambda _, url=plugin['page_url']: QDesktopServices.openUrl(QUrl(url)))
-                button_layout.addWidget(page_button, 1)
-
-                status_frame = QFrame()
-                status_frame.setFrameShape(QFrame.Box)
-                status_frame.setFrameShadow(QFrame.Raised)
-                status_frame_layout = QHBoxLayout(status_frame)
-                status_frame_layout.setContentsMargins(0, 0, 0, 0)
-                status_frame_layout.setSpacing(0)
-
-                status_label = QLabel("Installed" if plugin_installed else "Not Installed")
-                status_label.setAlignment(Qt.AlignCenter)
-                status_label.setObjectName(f"status_label_{plugin['name']}")
-                status_label.setStyleSheet("font-weight: bold;" if plugin_installed else "font-weight: bold; color: red;")
-                status_frame_layout.addWidget(status_label)
-
-                if not plugin_installed:
-                    install_button = QPushButton("Auto-Install")
-                    install_button.setObjectName(f"install_button_{plugin['name']}")
-                    install_button.setStyleSheet("background-color: #e5f3ff; font-weight: bold;")
-                    install_button.clicked.connect(lambda _, p=plugin: self.install_plugin(p))
-                    status_frame_layout.addWidget(install_button)
-
-                status_frame_layout.setStretch(0, 2)
-                status_frame_layout.setStretch(1, 2)
-
-                button_layout.addWidget(status_frame, 2)
-
-                plugin_layout.addLayout(button_layout)
-
-                # Add the plugin layout to the main plugin layout
-                self.plugin_layout.addLayout(plugin_layout)
-                print(f"Added plugin layout for {plugin['name']} to the layout")  # Debugging statement
-
-        # Start the timer if not all required plugins are installed
         if not all_required_installed:
-            print("Not all required plugins are installed. Starting the timer.")
-            self.timer.start(5000)
+            print("Not all required plugins are installed. Watching the plugins folder.")
         else:
             print("All required plugins are installed. Copying SEF and showing alert.")
             success = self.copy_sef_to_downloads()
@@ -804,37 +789,19 @@ class OBSPluginInstaller(QWidget):
             return False
 
         all_required_installed = True  # Change this to track only required plugins
-        for i in range(self.plugin_layout.count()):
-            plugin_layout = self.plugin_layout.itemAt(i).layout()
-            if plugin_layout:
-                status_label = plugin_layout.itemAt(1).layout().itemAt(1).widget().findChild(QLabel)
-                if status_label:
-                    plugin_name = status_label.objectName().split("_")[2]
-                    plugin = next((p for p in self.plugins if p["name"] == plugin_name), None)
-                    if plugin:
-                        plugin_installed = os.path.exists(os.path.join(plugins_folder, plugin["file_name"]))
-                        if plugin_installed:
-                            status_label.setText("Installed")
-                            status_label.setStyleSheet("font-weight: bold;")
-
-                            install_button = plugin_layout.itemAt(1).layout().itemAt(1).widget().findChild(QPushButton, f"install_button_{plugin['name']}")
-                            if install_button:
-                                install_button.setVisible(False)
-                        else:
-                            if plugin.get("required", True):  # Only affect all_required_installed if it's a required plugin
-                                all_required_installed = False
-                            status_label.setText("Not Installed")
-                            status_label.setStyleSheet("font-weight: bold; color: red;")
-
-                            install_button = plugin_layout.itemAt(1).layout().itemAt(1).widget().findChild(QPushButton, f"install_button_{plugin['name']}")
-                            if install_button:
-                                install_button.setVisible(True)
+        installed = self.plugin_status(plugins_folder)
+        for name, row in self.plugin_rows.items():
+            if installed[name]:
+                self.set_plugin_status(row["plugin"], "Installed")
+            else:
+                if row["plugin"].get("required", True):  # Only affect all_required_installed if it's a required plugin
+                    all_required_installed = False
+                self.set_plugin_status(row["plugin"], "Not Installed", "red")
 
         # Only show alert if it hasn't been shown yet and we're not in the middle of installing
         if not self.plugin_alert_shown and not hasattr(self, 'installation_in_progress'):
             # Check if all required plugins are installed
-            all_required_installed = all(os.path.exists(os.path.join(plugins_folder, p["file_name"])) 
-                                      for p in self.plugins if p.get("required", True))
+            all_required_installed = all(installed[p["name"]] for p in self.plugins if p.get("required", True))
             if all_required_installed:
                 print("Showing initial alert")
                 self.plugin_alert_shown = True
@@ -845,94 +812,111 @@ class OBSPluginInstaller(QWidget):
             self.adjustSize()
             self.layout_updated = True
 
+        self.update_install_all_button(plugins_folder)
+
         return all_required_installed
 
-    def on_plugin_download_finished(self, zip_path, plugin):
-        import zipfile
-        try:
-            # Get OBS root directory
-            obs_root = os.path.dirname(os.path.dirname(os.path.dirname(self.obs_exe_path)))
-            
-            # Extract all files from the zip to the OBS root directory
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(obs_root)
-                
-            # Clean up temp folder
-            temp_folder = os.path.dirname(zip_path)
-            shutil.rmtree(temp_folder)
-            
-            self.progress_bar.setVisible(False)
-                  
-            # Store the popup reference
-            self.current_popup = PopupBox("Plugin Installed", 
-                f"The plugin '{plugin['name']}' has been installed successfully.", self)
+    def on_plugin_install_finished(self, zip_path, plugin):
+        # The worker has already extracted and registered the archive
+        print(f"Installed {plugin['name']} from {zip_path}")
+        self.set_plugin_status(plugin, "Installed")
+        self.on_plugin_install_done(plugin)
 
-            # Check if all required plugins are installed
-            all_required_installed = True
-            obs_plugins_folder = os.path.join(obs_root, "obs-plugins", "64bit")
-            for i in range(self.plugin_layout.count()):
-                plugin_layout = self.plugin_layout.itemAt(i).layout()
-                if plugin_layout:
-                    status_label = plugin_layout.itemAt(1).layout().itemAt(1).widget().findChild(QLabel)
-                    if status_label:
-                        plugin_name = status_label.objectName().split("_")[2]
-                        current_plugin = next((p for p in self.plugins if p["name"] == plugin_name), None)
-                        if current_plugin and current_plugin.get("required", True):  # Only check required plugins
-                            plugin_installed = os.path.exists(os.path.join(obs_plugins_folder, current_plugin["file_name"]))
-                            if not plugin_installed:
-                                all_required_installed = False
-                                break
-
-            # Connect appropriate handler based on whether this is the final required plugin
-            if all_required_installed and plugin.get("required", True):  # Only trigger for required plugins
-                for button in self.current_popup.findChildren(QPushButton):
-                    if button.text() == "OK":
-                        button.clicked.disconnect()
-                        button.clicked.connect(lambda: self.handle_final_plugin_ok(self.current_popup))
-            else:
-                for button in self.current_popup.findChildren(QPushButton):
-                    if button.text() == "OK":
-                        button.clicked.disconnect()
-                        button.clicked.connect(lambda: self.handle_plugin_ok(self.current_popup))
+    def on_plugin_install_stage(self, stage, plugin):
+        if plugin['name'] not in self.pending_installs or stage == "download":
+            return
+        self.set_plugin_status(plugin, {"verify": "Verifying", "extract": "Extracting", "register": "Registering"}[stage], "#FFD700")
 
-            self.current_popup.show()
-            self.play_success_sound()
+    def on_plugin_install_cancelled(self, plugin):
+        print(f"Installation of {plugin['name']} cancelled")
+        self.install_cancelled.append(plugin)
+        self.set_plugin_status(plugin, "Not Installed", "red")
+        self.on_plugin_install_done(plugin)
 
-            # Update UI states
-            self.update_plugin_status(obs_plugins_folder)
-            QTimer.singleShot(100, self.update_layout)
+    def cancel_installs(self):
+        """Stop every running install, each one rolls back the files it already wrote"""
+        self.install_cancel.set()
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.setText("Cancelling...")
 
-        except Exception as e:
+    def on_plugin_install_done(self, plugin):
+        """Mark one plugin of the current batch as done and wrap up once the batch is empty"""
+        self.pending_installs.discard(plugin['name'])
+        current, total = self.install_progress.get(plugin['name'], (0, 0))
+        self.install_progress[plugin['name']] = (total, total) if total > 0 else (1, 1)
+        self.update_aggregate_progress()
+
+        if not self.pending_installs:
+            self.finish_install_batch()
+
+    def finish_install_batch(self):
+        plugins_folder = self.get_plugins_folder()
+
+        self.progress_bar.setVisible(False)
+        self.cancel_button.setVisible(False)
+
+        failed_names = {plugin['name'] for plugin, _ in self.install_failures}
+        failed_names.update(plugin['name'] for plugin in self.install_cancelled)
+        installed = [p for p in self.install_batch if p['name'] not in failed_names]
+
+        if self.install_failures:
             self.play_error_sound()
-            QMessageBox.critical(self, "Error", f"An error occurred during plugin installation: {str(e)}")
-            print(f"Error during plugin installation: {str(e)}")
-        finally:
-            if not self.timer.isActive():
-                self.timer.start(5000)
+            details = "\n".join(f"{plugin['name']}: {error}" for plugin, error in self.install_failures)
+            QMessageBox.critical(self, "Error", details)
+
+        if not installed:
+            self.installation_in_progress = False
+            self.update_plugin_layout(plugins_folder)
+            self.start_plugin_watch()
+            return
+
+        # Store the popup reference
+        if len(installed) == 1:
+            self.current_popup = PopupBox("Plugin Installed", 
+                f"The plugin '{installed[0]['name']}' has been installed successfully.", self)
+        else:
+            self.current_popup = PopupBox("Plugins Installed",
+                f"{len(installed)} plugins have been installed successfully:\n" + ", ".join(p['name'] for p in installed), self)
+
+        # Check if all required plugins are installed
+        status = self.plugin_status(plugins_folder)
+        all_required_installed = all(status[p["name"]] for p in self.plugins if p.get("required", True))
+
+        # Connect appropriate handler based on whether this batch finished the required plugins
+        if all_required_installed and any(p.get("required", True) for p in installed):  # Only trigger for required plugins
+            for button in self.current_popup.findChildren(QPushButton):
+                if button.text() == "OK":
+                    button.clicked.disconnect()
+                    button.clicked.connect(lambda: self.handle_final_plugin_ok(self.current_popup))
+        else:
+            for button in self.current_popup.findChildren(QPushButton):
+                if button.text() == "OK":
+                    button.clicked.disconnect()
+                    button.clicked.connect(lambda: self.handle_plugin_ok(self.current_popup))
+
+        self.current_popup.show()
+        self.play_success_sound()
+
+        # Update UI states
+        self.update_plugin_status(plugins_folder)
+        QTimer.singleShot(100, self.update_layout)
+
+        self.start_plugin_watch()
             
     def handle_plugin_ok(self, popup):
         """Handler for non-final plugin installations"""
         popup.close()
         self.current_popup = None
         self.installation_in_progress = False
+        # Hidden for the install, other plugins may still be missing
+        self.update_install_all_button(self.get_plugins_folder())
 
     def update_plugin_status(self, plugins_folder):
         """Update the UI status for all plugins"""
-        for i in range(self.plugin_layout.count()):
-            plugin_layout = self.plugin_layout.itemAt(i).layout()
-            if plugin_layout:
-                status_label = plugin_layout.itemAt(1).layout().itemAt(1).widget().findChild(QLabel)
-                if status_label:
-                    plugin_name = status_label.objectName().split("_")[2]
-                    current_plugin = next((p for p in self.plugins if p["name"] == plugin_name), None)
-                    if current_plugin:
-                        plugin_installed = os.path.exists(os.path.join(plugins_folder, current_plugin["file_name"]))
-                        if plugin_installed:
-                            status_label.setText("Installed")
-                            status_label.setStyleSheet("font-weight: bold;")
-                            install_button = plugin_layout.itemAt(1).layout().itemAt(1).widget().findChild(QPushButton, f"install_button_{current_plugin['name']}")
-                            if install_button:
-                                install_button.setVisible(False)
+        installed = self.plugin_status(plugins_folder)
+        for name, row in self.plugin_rows.items():
+            if installed[name]:
+                self.set_plugin_status(row["plugin"], "Installed")
 
     def update_layout(self):
         # Update the layout of this widget and all child widgets
@@ -955,73 +939,96 @@ class OBSPluginInstaller(QWidget):
         # Force a repaint
         self.repaint()
 
-    @pyqtSlot(str)
-    def on_plugin_download_error(self, error_message):
-        self.play_error_sound()
-        QMessageBox.critical(self, "Error", f"An error occurred during file download: {error_message}")
-        print(f"Error during file download: {error_message}")
-        self.progress_bar.setVisible(False)
-        self.timer.start(5000)  # Restart the timer
+    def on_plugin_install_error(self, error_message, plugin):
+        print(error_message)
+        self.install_failures.append((plugin, error_message))
+        self.set_plugin_status(plugin, "Failed", "red")
+        self.on_plugin_install_done(plugin)
 
     @pyqtSlot(dict)
     def install_plugin(self, plugin):
-        if not hasattr(self, 'requests'):
-            import requests
-            self.requests = requests  # Import once and store as instance variable
-            
-        if hasattr(self, 'installation_in_progress') and self.installation_in_progress:
+        self.start_installs([plugin])
+
+    def install_all_missing(self):
+        plugins_folder = self.get_plugins_folder()
+        installed = self.plugin_status(plugins_folder)
+        missing = [p for p in self.plugins if not installed[p["name"]]]
+        if missing:
+            self.start_installs(missing)
+
+    def start_installs(self, plugins):
+        """Download and install the given plugins in parallel, capped at MAX_PARALLEL_DOWNLOADS"""
+        obs_root = obs_root_folder(self.obs_exe_path)
+        if self.installation_in_progress:
             print("Installation already in progress")
             return
 
         self.installation_in_progress = True
         try:
-            # Stop the timer
-            if self.timer.isActive():
-                print("Stopping the timer for plugin installation.")
-                self.timer.stop()
-
-            temp_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
-            os.makedirs(temp_folder, exist_ok=True)
-
-            zip_path = os.path.join(temp_folder, f"{plugin['name']}.zip")
-            signals = DownloadSignals()
-            worker = DownloadWorker(plugin['download_url'], zip_path, signals)
-            
-            signals.finished.connect(lambda path: self.on_plugin_download_finished(path, plugin))
-            signals.error.connect(self.on_plugin_download_error)
-            signals.progress.connect(self.update_progress_bar)
-
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(0)
-            self.update_layout()
-            
-            QThreadPool.globalInstance().start(worker)
+            # Our own writes shouldn't trigger status refreshes mid-install
+            print("Pausing the plugins folder watch for plugin installation.")
+            self.stop_plugin_watch()
+
+            self.install_batch = list(plugins)
+            self.install_progress = {p['name']: (0, 0) for p in plugins}
+            self.install_rates = {}
+            self.pending_installs = {p['name'] for p in plugins}
+            self.install_failures = []
+            self.install_cancelled = []
+            self.install_signals = {}
+            self.install_cancel = threading.Event()
+
+            workers = []
+            for plugin in plugins:
+                signals = InstallSignals()
+                signals.stage.connect(lambda stage, p=plugin: self.on_plugin_install_stage(stage, p))
+                signals.finished.connect(lambda path, p=plugin: self.on_plugin_install_finished(path, p))
+                signals.error.connect(lambda message, p=plugin: self.on_plugin_install_error(message, p))
+                signals.cancelled.connect(lambda p=plugin: self.on_plugin_install_cancelled(p))
+                signals.progress.connect(lambda current, total, rate, eta, p=plugin:
+                                         self.update_progress_bar(current, total, p, rate))
+                # Keep the signals alive until the batch is done, the workers only borrow them
+                self.install_signals[plugin['name']] = signals
+                workers.append(InstallWorker(plugin, obs_root, signals, self.install_cancel))
         except Exception as e:
+            self.installation_in_progress = False
             QMessageBox.critical(self, "Error", f"An error occurred during plugin installation: {str(e)}")
             print(f"Error during plugin installation: {str(e)}")
-            
-            # Update the label to "Installed"
-            plugin_frame = self.plugin_layout.itemAt(self.plugins.index(plugin)).widget()
-            status_label = plugin_frame.findChild(QLabel, "status_label")
-            if status_label:
-                status_label.setText("Installed")
-                status_label.setStyleSheet("color: green; font-weight: bold;")
-            
-            # Remove the "Auto-Install" button
-            install_button = plugin_frame.findChild(QPushButton, "install_button")
-            if install_button:
-                install_button.setParent(None)
-            
-            self.check_plugins()
-            
-            # Start the timer if not all plugins are installed
-            if not self.update_plugin_layout(os.path.dirname(self.obs_exe_path)):
-                print("Not all plugins are installed. Restarting the timer.")
-                self.timer.start(5000)
+            self.start_plugin_watch()
+            return
+
+        for plugin in plugins:
+            self.set_plugin_status(plugin, "Queued", "#FFD700")
+        self.install_all_button.setVisible(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("%p%")
+        self.cancel_button.setText("Cancel")
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(True)
+        self.update_layout()
+
+        for worker in workers:
+            self.download_pool.start(worker)
+
+    def set_plugin_status(self, plugin, text, color=None):
+        row = self.plugin_rows.get(plugin['name'])
+        if row is None:
+            return
+        row["status_label"].setText(text)
+        row["status_label"].setStyleSheet(f"font-weight: bold; color: {color};" if color else "font-weight: bold;")
+
+        # The Auto-Install button only makes sense while the plugin is idle and missing
+        row["install_button"].setVisible(text == "Not Installed")
+
+    def update_install_all_button(self, plugins_folder):
+        missing = not all(self.plugin_status(plugins_folder).values())
+        self.install_all_button.setVisible(missing and not self.installation_in_progress)
 
     def handle_final_plugin_ok(self, popup):
             popup.close()
             self.installation_in_progress = False
+            self.update_install_all_button(self.get_plugins_folder())
             self.plugin_alert_shown = True
             success = self.copy_sef_to_downloads()
             if success:
@@ -1056,11 +1063,39 @@ class OBSPluginInstaller(QWidget):
         popup2.show()
         self.play_end_sound()
 
-    @pyqtSlot(int, int)
-    def update_progress_bar(self, current, total):
-        if total > 0:
-            progress = int((current / total) * 100)
-            self.progress_bar.setValue(progress)
+    def update_progress_bar(self, current, total, plugin=None, rate=0.0):
+        # Workers pass progress through installer_core.ProgressThrottle, so this runs at most
+        # PROGRESS_MAX_RATE times a second per download
+        if plugin is not None:
+            self.install_progress[plugin['name']] = (current, total)
+            self.install_rates[plugin['name']] = rate
+            if total > 0 and plugin['name'] in self.pending_installs:
+                self.set_plugin_status(plugin, f"Downloading {int((current / total) * 100)}%", "#FFD700")
+        self.update_aggregate_progress()
+
+    def update_aggregate_progress(self):
+        progress = list(self.install_progress.values())
+        if not progress:
+            return
+        if all(total > 0 for _, total in progress):
+            # Weight by size once every server has told us how big its file is
+            fraction = sum(current for current, _ in progress) / sum(total for _, total in progress)
+        else:
+            fraction = sum(current / total if total > 0 else 0 for current, total in progress) / len(progress)
+        self.progress_bar.setValue(int(fraction * 100))
+
+        # Throughput and time left over the downloads still running
+        running = [name for name, (current, total) in self.install_progress.items() if total <= 0 or current < total]
+        rate = sum(self.install_rates.get(name, 0.0) for name in running)
+        if rate <= 0:
+            self.progress_bar.setFormat("%p%")
+            return
+        text = f"%p%  ·  {rate / (1024 * 1024):.1f} MB/s"
+        if running and all(self.install_progress[name][1] > 0 for name in running):
+            remaining = sum(total - current for current, total in (self.install_progress[name] for name in running))
+            seconds = int(remaining / rate)
+            text += f"  ·  {seconds // 60}:{seconds % 60:02d} left"
+        self.progress_bar.setFormat(text)
 
     def copy_sef_to_downloads(self):
         try:
@@ -1071,8 +1106,6 @@ class OBSPluginInstaller(QWidget):
             self.extracting_popup.show()
             self.play_loading_sound()
             
-            downloads_path = os.path.join(os.path.expanduser('~'), 'Downloads')
-            
             # Updated path to look in the Required Sources directory
             if getattr(sys, 'frozen', False):
                 # If running as compiled executable
@@ -1081,10 +1114,7 @@ class OBSPluginInstaller(QWidget):
                 # If running as script
                 base_path = os.path.dirname(os.path.abspath(__file__))
                 
-            source_sef = os.path.join(base_path, 'MickFX Required Sources', 'MickFX Base.sef')
-            destination_sef = os.path.join(downloads_path, 'MickFX Base.sef')
-            
-            shutil.copy2(source_sef, destination_sef)
+            copy_sef(os.path.join(base_path, 'MickFX Required Sources', 'MickFX Base.sef'))
             return True
         except Exception as e:
             self.play_error_sound()
@@ -1093,18 +1123,388 @@ class OBSPluginInstaller(QWidget):
             error_popup.show()
             return False
 
-def resource_path(relative_path):
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+class ResourceRegistry:
+    """Every file from MickFX Required Sources the window uses, each read at most once.
+
+    Files are read on first use and kept in memory as bytes, and the pixmaps, icons, fonts and
+    media built from them are cached too, so asking twice never touches the disk again.
+    report() lists what was loaded and how often each file was opened. data(), image() and
+    media_size() may be called from worker threads (see AssetPreloader), the Qt objects built
+    from them only on the GUI thread.
+    """
+    def __init__(self, folder="MickFX Required Sources"):
+        self.folder = folder
+        self._data = {}
+        self._images = {}
+        self._sizes = {}
+        self._objects = {}
+        self._lock = threading.Lock()
+        self._name_locks = {}
+        self.reads = {}  # file name -> times it was opened, by us or by Qt
+
+    def path(self, name):
+        return resource_path(os.path.join(self.folder, name))
+
+    def source(self, name):
+        """Path of a file Qt opens itself (media playback, audio decoding), counted as a read"""
+        self._count_read(name)
+        return self.path(name)
+
+    def _count_read(self, name):
+        with self._lock:
+            self.reads[name] = self.reads.get(name, 0) + 1
+
+    def _name_lock(self, name):
+        # One lock per file, so a worker and the GUI thread never both read the same one
+        with self._lock:
+            return self._name_locks.setdefault(name, threading.RLock())
+
+    def data(self, name):
+        """Raw contents of the file as a QByteArray"""
+        with self._name_lock(name):
+            if name not in self._data:
+                with startup_trace.span(name, "asset"):
+                    self._count_read(name)
+                    try:
+                        with open(self.path(name), "rb") as file:
+                            self._data[name] = QByteArray(file.read())
+                    except OSError as e:
+                        print(f"Could not load {name}: {e}")
+                        self._data[name] = QByteArray()
+            return self._data[name]
+
+    def image(self, name):
+        """Decoded QImage of the file, QImage (unlike QPixmap) can be built off the GUI thread"""
+        with self._name_lock(name):
+            if name not in self._images:
+                data = self.data(name)
+                with startup_trace.span(f"decode {name}", "asset"):
+                    self._images[name] = QImage.fromData(data)
+            return self._images[name]
+
+    def media_size(self, name):
+        """Size of a sound file, checked ahead of time so a missing one shows up at startup"""
+        with self._name_lock(name):
+            if name not in self._sizes:
+                try:
+                    self._sizes[name] = os.path.getsize(self.path(name))
+                except OSError as e:
+                    print(f"Could not find {name}: {e}")
+                    self._sizes[name] = None
+            return self._sizes[name]
+
+    def _cached(self, kind, name, build):
+        key = (kind, name)
+        if key not in self._objects:
+            with startup_trace.span(f"{kind} {name}", "asset"):
+                self._objects[key] = build()
+        return self._objects[key]
+
+    def pixmap(self, name):
+        return self._cached("pixmap", name, lambda: QPixmap.fromImage(self.image(name)))
+
+    def icon(self, name):
+        return self._cached("icon", name, lambda: QIcon(self.pixmap(name)))
+
+    def font_family(self, name, fallback="Arial"):
+        """Register the font with Qt and return its family name"""
+        def build():
+            font_id = QFontDatabase.addApplicationFontFromData(self.data(name))
+            if font_id == -1:
+                print("Error loading custom font")
+                return fallback
+            return QFontDatabase.applicationFontFamilies(font_id)[0]
+        return self._cached("font", name, build)
+
+    def media(self, name):
+        # The media backend streams the file itself, only the content descriptor is shared
+        def build():
+            from PyQt5.QtMultimedia import QMediaContent
+            return QMediaContent(QUrl.fromLocalFile(self.source(name)))
+        return self._cached("media", name, build)
+
+    def report(self):
+        size = sum(data.size() for data in self._data.values())
+        files = ", ".join(f"{name} (x{count})" if count > 1 else name for name, count in sorted(self.reads.items()))
+        built = ", ".join(sorted(f"{kind} {name}" for kind, name in self._objects))
+        return f"Loaded {len(self._data)} files ({size / 1024:.0f} KB)\nOpened: {files}\nBuilt: {built}"
+
+resources = ResourceRegistry()
+
+# Assets loaded on worker threads while the splash is up, as (kind, name, critical), most urgent
+# first. The window is built and shown once the critical ones are in, the rest keep loading.
+STARTUP_ASSETS = [
+    ("image", "MickFX Background.jpg", True),
+    ("image", "MickFX Background2.jpg", True),
+    ("data", "Tomorrow-Medium.ttf", True),
+    ("data", "MickFX Logo.webp", False),
+    ("data", "MickFX Logo.gif", False),
+    ("image", "Volume Icon.png", False),
+    ("image", "Discord Logo.png", False),
+    ("image", "Youtube Logo.png", False),
+    ("image", "X Logo.png", False),
+    ("image", "Twitch Logo.png", False),
+    ("image", "Mute Icon.png", False),
+    ("media", "MickFX Song.mp3", False),
+    ("media", "Yoshi1.mp3", False),
+    ("media", "Yoshi2.mp3", False),
+    ("media", "Yoshi3.mp3", False),
+    ("media", "Yoshi Loading.mp3", False),
+    ("media", "Yoshi Error.mp3", False),
+    ("media", "Yoshi End.mp3", False),
+]
+
+class AssetPreloader(QObject):
+    """Loads assets into a ResourceRegistry on the global thread pool, in priority order.
+
+    critical_ready is emitted on the GUI thread once every critical asset is loaded, finished once
+    all of them are.
+    """
+    loaded = pyqtSignal(str)
+    critical_ready = pyqtSignal()
+    finished = pyqtSignal()
 
-    return os.path.join(base_path, relative_path)
+    def __init__(self, registry, assets, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.assets = assets
+        self.pending = {name for _, name, _ in assets}
+        self.pending_critical = {name for _, name, critical in assets if critical}
+        # Emitted from the worker threads, handled on the GUI thread
+        self.loaded.connect(self.on_loaded)
+
+    def start(self):
+        if not self.pending_critical:
+            self.critical_ready.emit()
+        pool = QThreadPool.globalInstance()
+        for priority, (kind, name, _) in enumerate(reversed(self.assets)):
+            pool.start(PreloadTask(self, kind, name), priority)
+
+    def on_loaded(self, name):
+        self.pending.discard(name)
+        if name in self.pending_critical:
+            self.pending_critical.discard(name)
+            if not self.pending_critical:
+                self.critical_ready.emit()
+        if not self.pending:
+            self.finished.emit()
+
+class PreloadTask(QRunnable):
+    def __init__(self, preloader, kind, name):
+        super().__init__()
+        self.preloader = preloader
+        self.kind = kind
+        self.name = name
+
+    def run(self):
+        registry = self.preloader.registry
+        try:
+            if self.kind == "image":
+                registry.image(self.name)
+            elif self.kind == "media":
+                registry.media_size(self.name)
+            else:
+                registry.data(self.name)
+        except Exception as e:
+            # The GUI thread loads it again on first use and reports the error there
+            print(f"Preloading {self.name} failed: {e}")
+        self.preloader.loaded.emit(self.name)
+
+# Short clips decoded up front and played through the shared sound effect output
+SOUND_EFFECTS = ("Yoshi1.mp3", "Yoshi2.mp3", "Yoshi3.mp3", "Yoshi Loading.mp3", "Yoshi Error.mp3", "Yoshi End.mp3")
+
+def mix_pcm(a, b):
+    """Add two equally long chunks of 16-bit PCM, clipping instead of wrapping around"""
+    if audioop:
+        return audioop.add(a, b, 2)
+    left, right = array.array("h", a), array.array("h", b)
+    return array.array("h", (max(-32768, min(32767, x + y)) for x, y in zip(left, right))).tobytes()
+
+def scale_pcm(data, factor):
+    if audioop:
+        return audioop.mul(data, 2, factor)
+    samples = array.array("h", data)
+    return array.array("h", (max(-32768, min(32767, int(x * factor))) for x in samples)).tobytes()
+
+class SoundMixer(QIODevice):
+    """Endless 16-bit PCM stream for QAudioOutput's pull mode that mixes every playing clip.
+
+    Silence is returned while nothing plays, idle is emitted when the last clip runs out.
+    """
+    idle = pyqtSignal()
+
+    def __init__(self, frame_bytes, parent=None):
+        super().__init__(parent)
+        self.frame_bytes = frame_bytes
+        self.voices = []  # [pcm, position] for every clip still playing
+        self.open(QIODevice.ReadOnly)
+
+    def play(self, pcm):
+        self.voices.append([pcm, 0])
+
+    def isSequential(self):
+        return True
+
+    def bytesAvailable(self):
+        return 65536 + super().bytesAvailable()
+
+    def readData(self, maxlen):
+        maxlen -= maxlen % self.frame_bytes
+        chunk = None
+        for voice in self.voices:
+            pcm, position = voice
+            piece = pcm[position:position + maxlen]
+            voice[1] = position + len(piece)
+            if len(piece) < maxlen:
+                piece += bytes(maxlen - len(piece))
+            chunk = piece if chunk is None else mix_pcm(chunk, piece)
+        if self.voices:
+            self.voices = [voice for voice in self.voices if voice[1] < len(voice[0])]
+            if not self.voices:
+                self.idle.emit()
+        return chunk if chunk is not None else bytes(maxlen)
+
+    def writeData(self, data):
+        return -1
+
+class SoundEffects(QObject):
+    """Sound effects decoded once into PCM and played through one shared QAudioOutput.
+
+    Each clip is decoded with QAudioDecoder when this is created, so playing one later only
+    queues its samples on the mixer, and overlapping clips are mixed instead of cutting each
+    other off. The output is suspended while idle. A clip that can't be decoded (yet) is played
+    through a QMediaPlayer instead.
+    """
+    SAMPLE_RATE = 44100
+    CHANNELS = 2
+    # Output buffer, kept short so a clip starts right away
+    BUFFER_MS = 60
+
+    def __init__(self, names, volume=0.5, parent=None):
+        from PyQt5.QtMultimedia import QAudioDeviceInfo, QAudioFormat
+        super().__init__(parent)
+        self.volume = volume
+        self.clips = {}
+        self.decoders = {}
+        self._fallback_player = None
+
+        self.format = QAudioFormat()
+        self.format.setSampleRate(self.SAMPLE_RATE)
+        self.format.setChannelCount(self.CHANNELS)
+        self.format.setSampleSize(16)
+        self.format.setCodec("audio/pcm")
+        self.format.setByteOrder(QAudioFormat.LittleEndian)
+        self.format.setSampleType(QAudioFormat.SignedInt)
+        device = QAudioDeviceInfo.defaultOutputDevice()
+        if not device.isFormatSupported(self.format):
+            self.format = device.nearestFormat(self.format)
+
+        self.mixer = SoundMixer(max(1, self.format.bytesPerFrame()), self)
+        self.mixer.idle.connect(self.on_idle)
+        self.output = None
+        self.suspend_timer = QTimer(self)
+        self.suspend_timer.setSingleShot(True)
+        self.suspend_timer.setInterval(self.BUFFER_MS * 4)
+        self.suspend_timer.timeout.connect(self.suspend)
+
+        # The mixer only handles signed 16-bit samples, anything else goes through the fallback
+        if self.format.sampleSize() == 16 and self.format.sampleType() == QAudioFormat.SignedInt:
+            for name in names:
+                self.decode(name)
+
+    def decode(self, name):
+        from PyQt5.QtMultimedia import QAudioDecoder
+        decoder = QAudioDecoder(self)
+        decoder.setAudioFormat(self.format)
+        decoder.setSourceFilename(resources.source(name))
+        chunks = []
+        decoder.bufferReady.connect(lambda: chunks.append(self.buffer_pcm(decoder.read())))
+        decoder.finished.connect(lambda: self.on_decoded(name, chunks))
+        decoder.error.connect(lambda _: self.on_decode_error(name, decoder.errorString()))
+        self.decoders[name] = decoder
+        decoder.start()
+
+    def buffer_pcm(self, buffer):
+        data = buffer.constData().asstring(buffer.byteCount())
+        buffer_format = buffer.format()
+        if (buffer_format.sampleRate() != self.format.sampleRate()
+                or buffer_format.channelCount() != self.format.channelCount()
+                or buffer_format.sampleSize() != 16):
+            # The decoder ignored the requested format, clips with an odd one use the fallback
+            return None
+        return data
+
+    def on_decoded(self, name, chunks):
+        decoder = self.decoders.pop(name, None)
+        if decoder is None:
+            return  # Already reported by on_decode_error
+        decoder.deleteLater()
+        if not chunks or any(chunk is None for chunk in chunks):
+            print(f"Can't mix {name}, playing it through a media player instead")
+            return
+        self.clips[name] = scale_pcm(b"".join(chunks), self.volume)
+        startup_trace.mark(f"decoded {name}", "asset")
+
+    def on_decode_error(self, name, message):
+        print(f"Could not decode {name}: {message}")
+        decoder = self.decoders.pop(name, None)
+        if decoder:
+            decoder.deleteLater()
+
+    def play(self, name):
+        from PyQt5.QtMultimedia import QAudio, QAudioOutput
+        pcm = self.clips.get(name)
+        if pcm is None:
+            player = self.fallback_player()
+            player.setMedia(resources.media(name))
+            player.play()
+            return
+
+        self.suspend_timer.stop()
+        self.mixer.play(pcm)
+        if self.output is None:
+            self.output = QAudioOutput(self.format, self)
+            self.output.setBufferSize(self.format.bytesForDuration(self.BUFFER_MS * 1000))
+            self.output.start(self.mixer)
+        elif self.output.state() == QAudio.SuspendedState:
+            self.output.resume()
+
+    def on_idle(self):
+        # Let the samples already in the output buffer play out before suspending
+        self.suspend_timer.start()
+
+    def suspend(self):
+        if self.output is not None and not self.mixer.voices:
+            self.output.suspend()
+
+    def fallback_player(self):
+        if self._fallback_player is None:
+            from PyQt5.QtMultimedia import QMediaPlayer
+            self._fallback_player = QMediaPlayer(self)
+            self._fallback_player.setVolume(int(self.volume * 100))
+        return self._fallback_player
+
+def image_reader(data):
+    """QImageReader over bytes already in memory, the buffer is kept alive on the reader"""
+    buffer = QBuffer()
+    buffer.setData(data)
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    reader.buffer = buffer
+    return reader
+
+def logo_animation_name():
+    """First header logo in LOGO_ANIMATIONS that has more than one frame"""
+    for name in LOGO_ANIMATIONS:
+        reader = image_reader(resources.data(name))
+        if reader.canRead() and reader.supportsAnimation() and reader.imageCount() > 1:
+            return name
+    return LOGO_ANIMATIONS[-1]
 
 class DarkOverlay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.covering = False
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
@@ -1147,9 +1547,23 @@ class DarkOverlay(QWidget):
         except RuntimeError:
             return True
         
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.covering = True
+        self.notify_parent()
+
+    def notify_parent(self):
+        # The installer pauses its header animation while an overlay covers it
+        update_logo_playback = getattr(self.parent(), "update_logo_playback", None)
+        if update_logo_playback:
+            update_logo_playback()
+
     def cleanup(self):
         if self.parent():
             self.parent().resizeEvent = self.original_parent_resize
+            if self.covering:
+                self.covering = False
+                self.notify_parent()
         
     def closeEvent(self, event):
         self.cleanup()
@@ -1612,44 +2026,106 @@ class DetailedPopupBox(QWidget):
         super().closeEvent(event)
 
 class ScalingClickableLabel(QLabel):
+    """Clickable logo that plays an animation scaled to 80% of its parent's width.
+
+    Each frame is decoded and scaled once per target width, the first time it is shown, into a
+    ring of pixmaps. Later loops only blit the cached frames, and the ring is rebuilt only when
+    the parent's width changes. Frames due sooner than the LOGO_MAX_FPS budget are folded into
+    the frame before them, so they are neither scaled, cached nor painted.
+    """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setAlignment(Qt.AlignCenter)
-        self._pixmap = None
-        self._scaled_pixmap = None
+        self._source = None
+        self._speed = 100
+        self._reader = None
+        self._frames = []  # (scaled pixmap, delay in ms) per frame
+        self._frame_index = -1
+        self._frame_width = None
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self.nextFrame)
         self.setCursor(Qt.PointingHandCursor)
         self.setAttribute(Qt.WA_TranslucentBackground)  # Make the widget background transparent
         self.setStyleSheet("background-color: transparent;")  # Ensure transparent background
 
-    def setMovie(self, movie):
-        self.movie = movie
-        self.movie.frameChanged.connect(self.onFrameChanged)
-        super().setMovie(self.movie)
-
-    def onFrameChanged(self):
-        self._pixmap = self.movie.currentPixmap()
+    def setAnimation(self, data, speed=100):
+        """Play the animated image in data, speed is a percentage like QMovie.setSpeed"""
+        self._source = data
+        self._speed = speed
+        self._frame_width = None
         self.updatePixmap()
 
+    def start(self):
+        if not self._frame_timer.isActive():
+            self.nextFrame()
+
+    def stop(self):
+        self._frame_timer.stop()
+
+    def target_width(self):
+        parent_width = self.parent().width() if self.parent() else self.width()
+        return int(parent_width * 0.8)
+
     def updatePixmap(self):
-        if self._pixmap:
-            parent_width = self.parent().width() if self.parent() else self.width()
-            target_width = int(parent_width * 0.8)
-            scaled_size = self._pixmap.size()
-            scaled_size.scale(target_width, self._pixmap.height(), Qt.KeepAspectRatio)
-            self._scaled_pixmap = self._pixmap.scaled(
-                scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.setFixedSize(self._scaled_pixmap.size())
+        # Only a new target width invalidates the ring, everything else reuses it
+        target_width = self.target_width()
+        if self._source is None or target_width == self._frame_width:
+            return
+        self._frame_width = target_width
+        self._frames = []
+        self._frame_index = -1
+        self._reader = image_reader(self._source)
+        if self._load_frame():
+            self.setFixedSize(self._frames[0][0].size())
+
+    def _load_frame(self):
+        """Decode and scale the next frame into the ring, False once the animation has no more"""
+        if self._reader is None:
+            return False
+        image = self._reader.read()
+        if image.isNull():
+            self._reader = None
+            return False
+        startup_trace.first("first logo frame decoded", "asset")
+        delay = self._frame_delay()
+        while delay < 1000 / LOGO_MAX_FPS:
+            if self._reader.read().isNull():
+                self._reader = None
+                break
+            delay += self._frame_delay()
+        scaled_size = image.size()
+        scaled_size.scale(self._frame_width, image.height(), Qt.KeepAspectRatio)
+        pixmap = QPixmap.fromImage(image.scaled(scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self._frames.append((pixmap, delay))
+        return True
+
+    def _frame_delay(self):
+        # How long the frame just read stays up, at the playback speed
+        delay = self._reader.nextImageDelay()
+        return (delay if delay > 0 else 100) * 100 / self._speed
+
+    def nextFrame(self):
+        self.updatePixmap()
+        index = self._frame_index + 1
+        if index >= len(self._frames) and not self._load_frame():
+            index = 0
+        if not self._frames:
+            return
+        self._frame_index = index
+        self.update()
+        if len(self._frames) > 1 or self._reader is not None:
+            self._frame_timer.start(max(1, int(self._frames[index][1])))
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.updatePixmap()
 
     def paintEvent(self, event):
-        if self._scaled_pixmap:
+        if self._frames and self._frame_index >= 0:
+            startup_trace.first("first logo frame")
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            painter.drawPixmap(self.rect(), self._scaled_pixmap)
+            painter.drawPixmap(0, 0, self._frames[self._frame_index][0])
         else:
             super().paintEvent(event)
 
@@ -1657,74 +2133,114 @@ class ScalingClickableLabel(QLabel):
         QDesktopServices.openUrl(QUrl("https://www.mickfx.com"))
         
         
-class LogoBackgroundWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.background_image = QPixmap(resource_path(os.path.join("MickFX Required Sources", "MickFX Background.jpg")))
-        self.setAttribute(Qt.WA_StyledBackground, True)
+class ScaledBackgroundWidget(QWidget):
+    """Widget painted with a background image stretched over its whole area.
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        scaled_image = self.background_image.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        painter.drawPixmap(self.rect(), scaled_image)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.update()
+    The scaled image is rendered once per widget size and device pixel ratio and kept in
+    QPixmapCache, so repaints from popup fades, overlay animations and logo frames are a plain
+    blit. Every background shares QPixmapCache's budget, and a resize drops the old entry.
+    """
+    image_name = None
 
-class ContentBackgroundWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.background_image = QPixmap(resource_path(os.path.join("MickFX Required Sources", "MickFX Background2.jpg")))
+        self.background_image = resources.pixmap(self.image_name)
         self.setAttribute(Qt.WA_StyledBackground, True)
+        self._scaled_key = None
+
+    def scaled_background(self):
+        ratio = self.devicePixelRatioF()
+        key = f"background:{self.image_name}:{self.width()}x{self.height()}@{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            # Same result as scaling to cover the widget and drawing that into its rect on every paint
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            painter = QPainter(pixmap)
+            painter.drawPixmap(self.rect(), self.background_image.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        self._scaled_key = key
+        return pixmap
 
     def paintEvent(self, event):
+        startup_trace.first(f"first paint {type(self).__name__}")
         painter = QPainter(self)
-        scaled_image = self.background_image.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        painter.drawPixmap(self.rect(), scaled_image)
+        painter.drawPixmap(0, 0, self.scaled_background())
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        if self._scaled_key:
+            QPixmapCache.remove(self._scaled_key)
+            self._scaled_key = None
         self.update()
 
-class DownloadWorker(QRunnable):
-    def __init__(self, url, output_path, signals):
+class LogoBackgroundWidget(ScaledBackgroundWidget):
+    image_name = "MickFX Background.jpg"
+
+class ContentBackgroundWidget(ScaledBackgroundWidget):
+    image_name = "MickFX Background2.jpg"
+
+class InstallWorker(QRunnable):
+    def __init__(self, plugin, destination, signals, cancel):
         super().__init__()
-        self.url = url
-        self.output_path = output_path
+        self.plugin = plugin
+        self.destination = destination
         self.signals = signals
+        self.cancel = cancel
 
     def run(self):
-        from tqdm import tqdm
-        import requests
+        # Runs the whole pipeline (download, verify, extract, register) off the GUI thread.
+        # Archives come from the download cache when possible, and entries are extracted
+        # while the archive downloads where the zip allows it.
+        install = PluginInstall(self.plugin, self.destination, cancel=self.cancel,
+                                on_stage=self.signals.stage.emit, progress=self.signals.progress.emit)
         try:
-            response = requests.get(self.url, stream=True)
-            response.raise_for_status()
-            total_size = int(response.headers.get('content-length', 0))
-
-            with open(self.output_path, 'wb') as file:
-                downloaded_size = 0
-                for data in response.iter_content(chunk_size=8192):
-                    size = file.write(data)
-                    downloaded_size += size
-                    self.signals.progress.emit(downloaded_size, total_size)
-
-            self.signals.finished.emit(self.output_path)
+            zip_path = install.run()
+        except InstallCancelled:
+            self.signals.cancelled.emit()
+            return
         except Exception as e:
-            self.signals.error.emit(str(e))
-
-class DownloadSignals(QObject):
+            if install.stage == "download":
+                self.signals.error.emit(f"An error occurred during file download: {str(e)}")
+            else:
+                self.signals.error.emit(f"An error occurred during plugin installation: {str(e)}")
+            return
+        # Files left from an earlier install that already match the archive aren't rewritten
+        journal = install.journal
+        if journal.skipped_files:
+            print(f"{self.plugin['name']}: {journal.skipped_files} files already up to date, "
+                  f"skipped {journal.skipped_bytes / 1024:.0f} KB")
+        self.signals.finished.emit(zip_path)
+
+class InstallSignals(QObject):
+    stage = pyqtSignal(str)
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
-    progress = pyqtSignal(int, int)
+    cancelled = pyqtSignal()
+    progress = pyqtSignal(int, int, float, float)
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')
+    # --trace [path] or MICKFX_TRACE=path writes a startup timeline on exit
+    trace_file = os.environ.get("MICKFX_TRACE")
+    if "--trace" in sys.argv:
+        index = sys.argv.index("--trace")
+        del sys.argv[index]
+        if index < len(sys.argv) and not sys.argv[index].startswith("-"):
+            trace_file = sys.argv.pop(index)
+        else:
+            trace_file = trace_file or "mickfx-startup-trace.json"
+    if trace_file:
+        startup_trace.enable(trace_file, origin=STARTED)
+        startup_trace.record("imports", STARTED, time.perf_counter())
+
+    with startup_trace.span("QApplication"):
+        app = QApplication(sys.argv)
+        app.setStyle('Fusion')
     
     # Create and show splash screen with webp logo
     splash_label = QLabel()
-    splash_pixmap = QPixmap(resource_path(os.path.join("MickFX Required Sources", "MickFX Logo.webp")))
+    splash_pixmap = resources.pixmap("MickFX Logo.webp")
     # Scale the pixmap to fit nicely in the splash screen
     scaled_pixmap = splash_pixmap.scaled(300, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
     
@@ -1742,16 +2258,30 @@ if __name__ == '__main__':
     screen = app.primaryScreen().geometry()
     splash_label.move(screen.center() - splash_label.rect().center())
     splash_label.show()
+    startup_trace.mark("splash shown")
     
-    # Pre-initialize heavy components
-    installer = OBSPluginInstaller()
-    installer.move(screen.center() - installer.rect().center())
-    
+    installer = None
+
+    @startup_trace.phase
     def show_main():
         installer.show()
         splash_label.close()
+
+    @startup_trace.phase
+    def start_installer():
+        # The backgrounds and font are decoded by now, the window is shown as soon as it is built
+        global installer
+        installer = OBSPluginInstaller()
+        installer.move(screen.center() - installer.rect().center())
+        installer.initialized.connect(show_main)
+
+    # Decode assets on worker threads while the splash is up, most urgent first
+    preloader = AssetPreloader(resources, STARTUP_ASSETS)
+    preloader.critical_ready.connect(start_installer)
+    preloader.finished.connect(lambda: startup_trace.mark("assets preloaded"))
+    preloader.start()
     
-    # Can reduce delay since static image loads faster than GIF
-    QTimer.singleShot(300, show_main)
-    
-    sys.exit(app.exec_())
\ No newline at end of file
+    exit_code = app.exec_()
+    print(resources.report())
+    startup_trace.write()
+    sys.exit(exit_code)
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""Fill in the sha256 and size of every plugin archive in a plugin manifest.
+
+Downloads each plugin's download_url once and writes the archive's sha256 and size into its
+entry, so installs verify the download (and cached copies) against them. Run it after
+changing a download_url, then check the diff before committing:
+
+    python pin_manifest.py                          the bundled MickFX Required Sources/plugins.json
+    python pin_manifest.py path/to/plugins.json --only "Source Clone"
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", nargs="?", default=os.path.join(ROOT, "MickFX Required Sources", "plugins.json"))
+    parser.add_argument("--only", help="comma-separated plugin names to pin, default all")
+    args = parser.parse_args()
+
+    from installer_core import DownloadVerifier, download_file, validate_manifest
+
+    with open(args.manifest, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    validate_manifest(json.loads(json.dumps(data)))
+    names = {name.strip().lower() for name in args.only.split(",")} if args.only else None
+
+    failed = 0
+    with tempfile.TemporaryDirectory() as folder:
+        for plugin in data["plugins"]:
+            if names is not None and plugin["name"].lower() not in names:
+                continue
+            verifier = DownloadVerifier(plugin["download_url"])
+            try:
+                download_file(plugin["download_url"], os.path.join(folder, "archive.zip"), verifier=verifier)
+            except Exception as e:
+                print(f"{plugin['name']}: download failed: {e}", file=sys.stderr)
+                failed += 1
+                continue
+            changed = plugin.get("sha256") not in (None, verifier.sha256) or plugin.get("size") not in (None, verifier.position)
+            plugin["sha256"] = verifier.sha256
+            plugin["size"] = verifier.position
+            print(f"{plugin['name']}: {verifier.sha256} {verifier.position} bytes{' (changed)' if changed else ''}")
+
+    validate_manifest(json.loads(json.dumps(data)))
+    with open(args.manifest, "w", encoding="utf-8", newline="\n") as file:
+        json.dump(data, file, indent=4, ensure_ascii=False)
+        file.write("\n")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Incremental installs never commit a copy of an entry that streaming extraction left unfinished."""
+import io
+import os
+import random
+import sys
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from installer_core import InstallJournal, StreamingExtractor, extract_archive
+
+class Unseekable(io.RawIOBase):
+    """Write-only stream, zipfile then gives every entry a data descriptor"""
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+def descriptor_archive(path, name, content):
+    stream = Unseekable()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(name, content)
+    with open(path, "wb") as file:
+        file.write(stream.data)
+    return bytes(stream.data)
+
+def test_abandoned_descriptor_entry_keeps_the_live_file(tmp_path):
+    content = random.Random(0).randbytes(3_000_000)
+    archive = descriptor_archive(tmp_path / "plugin.zip", "obs-plugins/64bit/x.dll", content)
+    destination = tmp_path / "obs"
+    live_path = destination / "obs-plugins" / "64bit" / "x.dll"
+    live_path.parent.mkdir(parents=True)
+    live_path.write_bytes(content)
+
+    journal = InstallJournal(str(destination), "plugin")
+    extractor = StreamingExtractor(str(destination), journal, incremental=True)
+    # The connection drops half way through the entry and the retry starts over
+    extractor.write(archive[:len(archive) // 2])
+    assert journal.files
+    extractor.abandon("the download restarted from the beginning")
+
+    extract_archive(str(tmp_path / "plugin.zip"), str(destination), skip=extractor.extracted, journal=journal,
+                    incremental=True)
+    journal.commit()
+
+    assert live_path.read_bytes() == content
+    assert journal.skipped_files == 1
+
+def test_abandoned_descriptor_entry_is_written_again(tmp_path):
+    content = random.Random(1).randbytes(3_000_000)
+    archive = descriptor_archive(tmp_path / "plugin.zip", "obs-plugins/64bit/x.dll", content)
+    destination = tmp_path / "obs"
+    live_path = destination / "obs-plugins" / "64bit" / "x.dll"
+    live_path.parent.mkdir(parents=True)
+    live_path.write_bytes(b"an older build")
+
+    journal = InstallJournal(str(destination), "plugin")
+    extractor = StreamingExtractor(str(destination), journal, incremental=True)
+    extractor.write(archive[:len(archive) // 2])
+    extractor.abandon("the download restarted from the beginning")
+
+    extract_archive(str(tmp_path / "plugin.zip"), str(destination), skip=extractor.extracted, journal=journal,
+                    incremental=True)
+    journal.commit()
+
+    assert live_path.read_bytes() == content
+    assert journal.skipped_files == 0
@@ -0,0 +1,138 @@
+"""Every file in MickFX Required Sources is opened at most once while the window starts up.
+
+Runs the startup the way __main__ does (AssetPreloader, then the window's staged init up to the
+background music and sound effect decoding) offscreen, with QtMultimedia replaced by stand-ins
+that record the paths Qt would open. Opens are counted where they happen: builtins.open for
+files the installer reads itself, QMediaContent and QAudioDecoder.setSourceFilename for files
+Qt opens.
+"""
+import builtins
+import importlib.util
+import os
+import sys
+import time
+import types
+from collections import Counter
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtCore = pytest.importorskip("PyQt5.QtCore")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS = os.path.join(ROOT, "MickFX Required Sources")
+
+def asset_name(path):
+    """File name of path if it is in MickFX Required Sources, else None"""
+    path = os.path.normcase(os.path.abspath(os.fspath(path)))
+    if os.path.dirname(path) == os.path.normcase(ASSETS):
+        return os.path.basename(path)
+    return None
+
+def fake_multimedia(opened):
+    """PyQt5.QtMultimedia stand-in that records the asset paths handed to Qt in opened"""
+    module = types.ModuleType("PyQt5.QtMultimedia")
+
+    class QMediaContent:
+        def __init__(self, url):
+            name = asset_name(url.toLocalFile())
+            if name:
+                opened.append(name)
+
+    class QMediaPlayer(QtCore.QObject):
+        stateChanged = QtCore.pyqtSignal(int)
+        mediaStatusChanged = QtCore.pyqtSignal(int)
+
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: None
+
+    class QAudioDecoder(QtCore.QObject):
+        bufferReady = QtCore.pyqtSignal()
+        finished = QtCore.pyqtSignal()
+        error = QtCore.pyqtSignal(int)
+
+        def setSourceFilename(self, path):
+            name = asset_name(path)
+            if name:
+                opened.append(name)
+
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: None
+
+    class QAudioFormat:
+        LittleEndian = 1
+        SignedInt = 1
+
+        def __init__(self):
+            self.values = {}
+
+        def __getattr__(self, name):
+            if name.startswith("set"):
+                return lambda value: self.values.__setitem__(name[3:].lower(), value)
+            return lambda *args: self.values.get(name.lower(), 0)
+
+    class QAudioDeviceInfo:
+        @staticmethod
+        def defaultOutputDevice():
+            return types.SimpleNamespace(isFormatSupported=lambda audio_format: True)
+
+    module.QMediaContent = QMediaContent
+    module.QMediaPlayer = QMediaPlayer
+    module.QAudioDecoder = QAudioDecoder
+    module.QAudioFormat = QAudioFormat
+    module.QAudioDeviceInfo = QAudioDeviceInfo
+    module.QAudio = types.SimpleNamespace(SuspendedState=3)
+    module.QAudioOutput = QMediaPlayer
+    return module
+
+def wait_for(app, condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "startup did not finish"
+        app.processEvents(QtCore.QEventLoop.AllEvents, 50)
+
+@pytest.fixture
+def opened(monkeypatch):
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        if isinstance(file, (str, bytes, os.PathLike)):
+            name = asset_name(file)
+            if name:
+                opened.append(name)
+        return real_open(file, *args, **kwargs)
+
+    import PyQt5
+    multimedia = fake_multimedia(opened)
+    monkeypatch.setitem(sys.modules, "PyQt5.QtMultimedia", multimedia)
+    monkeypatch.setattr(PyQt5, "QtMultimedia", multimedia, raising=False)
+    monkeypatch.setattr(builtins, "open", counting_open)
+    # resource_path() resolves against the working directory when not frozen
+    monkeypatch.chdir(ROOT)
+    monkeypatch.syspath_prepend(ROOT)
+    return opened
+
+def test_startup_opens_each_asset_once(opened):
+    spec = importlib.util.spec_from_file_location("mickfx_installer", os.path.join(ROOT, "mickfx-plugin-installer.py"))
+    installer = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(installer)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    preloader = installer.AssetPreloader(installer.resources, installer.STARTUP_ASSETS)
+    preloaded = []
+    preloader.finished.connect(lambda: preloaded.append(True))
+    preloader.start()
+    wait_for(app, lambda: preloaded)
+
+    window = installer.OBSPluginInstaller()
+    wait_for(app, lambda: window._sound_effects is not None)
+    QtCore.QThreadPool.globalInstance().waitForDone()
+
+    counts = Counter(opened)
+    assert {name: count for name, count in counts.items() if count > 1} == {}
+    # The song and every clip were handed to Qt, so the stand-ins above saw the Qt opens
+    assert {"MickFX Song.mp3", *installer.SOUND_EFFECTS} <= set(counts)
+    assert installer.resources.reads == dict(counts)
+    window.deleteLater()